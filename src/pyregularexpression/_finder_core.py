@@ -0,0 +1,84 @@
+"""
+_finder_core.py – tokenisation and char→token mapping shared by the finder modules.
+Private helpers (not re-exported by the package):
+    • token_spans  – start/end char offsets of every whitespace-delimited token
+    • char_to_word – indices of the tokens holding the first and last char of a span
+    • for_text     – the re.ASCII twin of a pattern when that cannot change its matches
+    • cached_finder / clear_finder_cache – per-text memoisation of finder results
+"""
+from __future__ import annotations
+import functools
+import re
+from bisect import bisect_left, bisect_right
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+# Every code point ``\s`` matches (str.isspace); a token is a maximal run of
+# anything else, exactly as re.finditer(r"\S+", text) would yield it.
+WS_CODEPOINTS = np.array(
+    [0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x20, 0x85, 0xA0,
+     0x1680, *range(0x2000, 0x200B), 0x2028, 0x2029, 0x202F, 0x205F, 0x3000],
+    dtype=np.uint32,
+)
+
+def token_spans(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Token start/end offsets via a vectorised whitespace mask."""
+    cps = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    edges = np.diff((~np.isin(cps, WS_CODEPOINTS)).astype(np.int8), prepend=0, append=0)
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+def char_to_word(span: Tuple[int, int], starts: Sequence[int]) -> Tuple[int, int]:
+    """Indices of the tokens holding the first and last char of *span*."""
+    s_char, e_char = span
+    return bisect_right(starts, s_char) - 1, bisect_left(starts, e_char) - 1
+
+# re.ASCII only changes what \w, \W, \b, \d, \s and case-insensitive matching
+# accept.  On pure-ASCII text they all behave as in Unicode mode except \s,
+# which also matches the separators \x1c-\x1f in Unicode mode.
+_INFO_SEPARATOR_RE = re.compile(r"[\x1c-\x1f]")
+
+@functools.lru_cache(maxsize=128)
+def _ascii_safe(text: str) -> bool:
+    return text.isascii() and _INFO_SEPARATOR_RE.search(text) is None
+
+@functools.lru_cache(maxsize=None)
+def _ascii_twin(pattern: re.Pattern[str]) -> re.Pattern[str]:
+    return re.compile(pattern.pattern, (pattern.flags & ~re.UNICODE) | re.ASCII)
+
+def for_text(pattern: re.Pattern[str], text: str) -> re.Pattern[str]:
+    """*pattern*, or its faster re.ASCII twin when *text* makes the two equivalent.
+
+    The twin also serves any slice of *text*, which is ASCII-safe as well.
+    """
+    return _ascii_twin(pattern) if _ascii_safe(text) else pattern
+
+_FINDER_CACHES: List[Callable[[], None]] = []
+
+# Sized for re-running the ladder over the texts at hand, not for holding a
+# corpus: one-pass batch runs never hit, so keep what they pin alive small.
+FINDER_CACHE_SIZE = 128
+
+def cached_finder(fn: Callable[..., List[Tuple[int, int, str]]]) -> Callable[..., List[Tuple[int, int, str]]]:
+    """Memoise *fn* on its arguments (the text, window sizes, …).
+
+    The cache holds an immutable tuple; every call returns a fresh list, so
+    callers may still mutate what they get back.
+    """
+    @functools.lru_cache(maxsize=FINDER_CACHE_SIZE)
+    def cached(*args, **kwargs) -> Tuple[Tuple[int, int, str], ...]:
+        return tuple(fn(*args, **kwargs))
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> List[Tuple[int, int, str]]:
+        return list(cached(*args, **kwargs))
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    _FINDER_CACHES.append(cached.cache_clear)
+    return wrapper
+
+def clear_finder_cache() -> None:
+    """Drop every memoised finder result (e.g. in long-running services)."""
+    for cache_clear in _FINDER_CACHES:
+        cache_clear()
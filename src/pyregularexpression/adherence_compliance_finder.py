@@ -19,7 +19,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(spans))) if a < e <= b or e == b)
+    w_e = next(i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b or e == b)
     return w_s, w_e
 
 ADH_CUE_RE = re.compile(r"\b(?:adherence|compliance|medication\s+possession\s+ratio|mpr|proportion\s+of\s+days\s+covered|pdc|pill\s+counts?)\b", re.I)
@@ -19,10 +19,11 @@ def _token_spans(text: str) -> List[Tuple[int,int]]:
 def _char_span_to_word_span(span: Tuple[int,int], token_spans: Sequence[Tuple[int,int]]) -> Tuple[int,int]:
     s_char, e_char = span
     w_start = next(i for i,(s,e) in enumerate(token_spans) if s<=s_char<e)
-    w_end = next(i for i,(s,e) in reversed(list(enumerate(token_spans))) if s<e_char<=e)
+    w_end = next(i for i,(s,e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s<e_char<=e)
     return w_start, w_end
 
 ALGO_TERM_RE = re.compile(r"\balgorithm\b", re.I)
+ALGO_VALIDATION_RE = re.compile(r"algorithm\s+validation", re.I)
 VALIDATE_VERB_RE = re.compile(r"\b(?:validated|validation|evaluated|assessed|tested|performance)\b", re.I)
 METRIC_TOKEN_RE = re.compile(r"\b(?:ppv|npv|positive\s+predictive\s+value|negative\s+predictive\s+value|sensitivity|specificity|accuracy|f1|auc|area\s+under\s+the\s+curve|kappa)\b", re.I)
 HEADING_VALID_RE = re.compile(r"(?m)^(?:algorithm\s+validation|validation\s+study|performance\s+evaluation)\s*[:\-]?\s*$", re.I)
@@ -40,7 +41,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_algorithm_validation_v1(text:str):
-    return _collect([re.compile(r"algorithm\s+validation",re.I), VALIDATE_VERB_RE, METRIC_TOKEN_RE], text)
+    return _collect([ALGO_VALIDATION_RE, VALIDATE_VERB_RE, METRIC_TOKEN_RE], text)
 
 def find_algorithm_validation_v2(text:str, window:int=4):
     token_spans=_token_spans(text); tokens=[text[s:e] for s,e in token_spans]
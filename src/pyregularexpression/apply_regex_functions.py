@@ -1,4 +1,6 @@
-from typing import Callable, Sequence, Any, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Sequence, Any, Dict, List, Tuple, Optional
 
 # import your regex‐finder functions
 from pyregularexpression.algorithm_validation_finder import find_algorithm_validation_v1
@@ -18,10 +20,13 @@ from pyregularexpression.medical_code_finder import find_medical_code_v1
 from pyregularexpression.outcome_definition_finder import find_outcome_definition_v1
 from pyregularexpression.outcome_endpoints_finder import find_outcome_endpoints_v1
 from pyregularexpression.severity_definition_finder import find_severity_definition_v1
+from pyregularexpression._finder_core import clear_finder_cache
 
 __all__ = [
     "REGEX_FUNCS_PHENOTYPE_ALGORITHM_1",
     "apply_regex_funcs",
+    "apply_regex_funcs_batch",
+    "clear_finder_cache",
 ]
 
 # assemble into a list for iteration
@@ -71,3 +76,25 @@ def apply_regex_funcs(
         "matches": results,
         "any_match": any(bool(v) for v in results.values()),
     }
+
+
+def apply_regex_funcs_batch(
+    texts: Sequence[str],
+    regex_funcs: Sequence[Callable[..., List[Tuple[int,int,str]]]],
+    max_workers: Optional[int] = None,
+    chunksize: int = 64,
+) -> List[Dict[str, Any]]:
+    """
+    Apply `apply_regex_funcs` to every text in `texts`, preserving order.
+
+    The finders are pure-Python regex code and hold the GIL, so the batch is
+    spread over worker *processes*; `regex_funcs` must therefore be picklable
+    (module-level functions, as every finder in this package is).  Batches no
+    larger than `chunksize`, or `max_workers=1`, run in-process to skip the
+    pool start-up cost.
+    """
+    if max_workers == 1 or len(texts) <= chunksize:
+        return [apply_regex_funcs(t, regex_funcs) for t in texts]
+    work = partial(apply_regex_funcs, regex_funcs=list(regex_funcs))
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(work, texts, chunksize=chunksize))
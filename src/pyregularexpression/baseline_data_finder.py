@@ -19,15 +19,19 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a<e<=b)
     return w_s, w_e
 
 NUM_RE = r"\d+(?:\.\d+)?%?"
 NUM_TOKEN_RE = re.compile(r"^\d+(?:\.\d+)?%?$" )
+NUM_PAT = re.compile(NUM_RE)
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[\.\n])\s+")
+BLOCK_VAR_RE = re.compile(r"\b(?:age|bmi|sex|weight|height|%|\d+)\b", re.I)
 BASELINE_CUE_RE = re.compile(
     r"\b(?:baseline(?:\s+(?:characteristics|demographics|data))?|at\s+baseline|table\s+1)\b",
     re.I
 )
+CUE_NUM_RE = re.compile(rf"{BASELINE_CUE_RE.pattern}[^\n]{{0,30}}{NUM_RE}", re.I)
 GROUP_RE = re.compile(r"\b(?:treatment|intervention|placebo|control|group|arm|vs|versus|compared\s+to)\b", re.I)
 VAR_RE = re.compile(r"\b(?:age|sex|gender|male|female|bmi|body\s+mass\s+index|weight|height|smokers?|comorbidities?|race|ethnicity)\b", re.I)
 HEAD_BASE_RE = re.compile(r"(?m)^(?:baseline\s+characteristics|table\s+1|baseline\s+data)\s*[:\-]?\s*$", re.I)
@@ -52,17 +56,16 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_baseline_data_v1(text: str):
-    pattern=re.compile(rf"{BASELINE_CUE_RE.pattern}[^\n]{{0,30}}{NUM_RE}", re.I)
-    return _collect([pattern], text)
+    return _collect([CUE_NUM_RE], text)
 
 def find_baseline_data_v2(text: str, window: int = 8):
     spans = _token_spans(text)
     tokens = [text[s:e] for s, e in spans]
     out = []
-    sentences = re.split(r"(?<=[\.\n])\s+", text)
+    sentences = SENTENCE_SPLIT_RE.split(text)
 
     for sent in sentences:
-        if BASELINE_CUE_RE.search(sent) and GROUP_RE.search(sent) and re.search(NUM_RE, sent):
+        if BASELINE_CUE_RE.search(sent) and GROUP_RE.search(sent) and NUM_PAT.search(sent):
             for m in BASELINE_CUE_RE.finditer(sent):
                 abs_start = text.find(sent) + m.start()
                 abs_end = text.find(sent) + m.end()
@@ -80,7 +83,7 @@ def find_baseline_data_v3(text: str, block_chars: int = 400):
     out = []
     for s, e in blocks:
         block_text = text[s:e]
-        for m in re.finditer(r"\b(?:age|bmi|sex|weight|height|%|\d+)\b", block_text, re.I):
+        for m in BLOCK_VAR_RE.finditer(block_text):
             abs_start = s + m.start()
             abs_end = s + m.end()
             w_s, w_e = _char_to_word((abs_start, abs_end), spans)
@@ -95,7 +98,7 @@ def find_baseline_data_v4(text: str, window: int = 8):
     for w_s, w_e, snip in matches:
         context = " ".join(tokens[max(0, w_s - window):min(len(tokens), w_e + window)])
         vars_found = set(VAR_RE.findall(context))
-        nums_found = re.findall(NUM_RE, context)
+        nums_found = NUM_PAT.findall(context)
         if len(vars_found) >= 2 or len(nums_found) >= 2:
             out.append((w_s, w_e, snip))
     return out
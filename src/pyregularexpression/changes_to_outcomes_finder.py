@@ -20,7 +20,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(spans))) if a < e <= b)
+    w_e = next(i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b)
     return w_s, w_e
 
 # regex assets
@@ -61,12 +61,9 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     out: List[Tuple[int, int, str]] = []
     for patt in patterns:
         for m in patt.finditer(text):
-            print(f"[DEBUG] Regex matched: '{m.group(0)}' at span {m.start()}–{m.end()}")
             if TRAP_RE.search(text[max(0, m.start()-30):m.end()+30]):  # Trap detection
-                print("[DEBUG] Trap detected, skipping match:", m.group(0))
                 continue
             w_s, w_e = _char_to_word((m.start(), m.end()), spans)
-            print("[DEBUG] Adding match:", m.group(0))
             out.append((w_s, w_e, m.group(0)))
     return out
 
@@ -23,7 +23,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -53,6 +53,7 @@ DIVIDED_GROUPS_RE = re.compile(
 )
 
 TRAP_RE = re.compile(r"\b(?:compared\s+to|comparison\s+with|device\s+comparator|comparative\s+analysis)\b", re.I)
+QUOTED_TOKEN_RE = re.compile(r"['\"].+['\"]")
 
 TIGHT_TEMPLATE_RE = re.compile(
     r"""(?x)
@@ -80,7 +81,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int,
     return out
 
 def is_quoted(token: str) -> bool:
-    return re.fullmatch(r"['\"].+['\"]", token) is not None
+    return QUOTED_TOKEN_RE.fullmatch(token) is not None
 
 # ─────────────────────────────
 # Finder tiers
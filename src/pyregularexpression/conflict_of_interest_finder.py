@@ -19,7 +19,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a<e<=b)
     return w_s, w_e
 
 COI_CUE_RE = re.compile(r"\b(?:conflicts?\s+of\s+interest|competing\s+interests?|conflict\s+disclosures?)\b", re.I)
@@ -29,6 +29,7 @@ COMPANY_RE = re.compile(r"\b(?:Pfizer|Novartis|Merck|Roche|AstraZeneca|Bayer|GSK
 NO_COI_RE = re.compile(r"\bno\s+(?:conflicts?|competing\s+interests?)\b", re.I)
 TIGHT_TEMPLATE_RE = re.compile(r"authors?\s+declare\s+no\s+competing\s+interests", re.I)
 TRAP_RE = re.compile(r"\bconflict(?:ing)?\s+evidence|conflict\s+with\s+previous\s+studies\b", re.I)
+NOT_RE = re.compile(r"\bnot\b", re.I)
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     spans=_token_spans(text)
@@ -53,7 +54,7 @@ def find_conflict_of_interest_v2(text: str, window: int = 4):
         cue_w_s, cue_w_e = _char_to_word(cue_match.span(), spans)
         for verb_match in VERB_RE.finditer(text):
             verb_w_s, verb_w_e = _char_to_word(verb_match.span(), spans)
-            if verb_w_s > 0 and re.search(r"\bnot\b", tokens[verb_w_s - 1], re.I):
+            if verb_w_s > 0 and NOT_RE.search(tokens[verb_w_s - 1]):
                 continue
             if abs(verb_w_s - cue_w_s) <= window:
                 out.append((cue_w_s, cue_w_e, cue_match.group(0)))
@@ -22,7 +22,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -19,7 +19,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a<e<=b)
     return w_s, w_e
 
 LINK_CUE_RE   = re.compile(r"\b(?:linkage|linked|linking|match(?:ed|ing)?)\b", re.I)
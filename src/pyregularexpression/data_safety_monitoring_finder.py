@@ -19,7 +19,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a<e<=b)
     return w_s, w_e
 
 DSMB_RE = re.compile(r"(?:\bindependent\s+)?(?:data\s+(?:and\s+)?safety\s+monitoring\s+(?:board|committee)|data\s+monitoring\s+committee|DSMB|DMC)", re.I)
@@ -20,7 +20,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next((i for i, (s, e) in enumerate(token_spans) if s <= s_char < e), 0)
-    w_end = next((i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e), len(token_spans)-1)
+    w_end = next((i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e), len(token_spans)-1)
     return w_start, w_end
 
 TYPE_KEYWORD_RE = re.compile(r"\b(?:ehr|electronic\s+health\s+records?|insurance\s+claims?|claims?\s+(?:data|records)|administrative\s+claims?|registry\s+data|registries|survey\s+data|population[- ]?based\s+registry|national\s+inpatient\s+sample|hospital\s+discharge\s+data)\b",re.I)
@@ -29,6 +29,7 @@ QUALIFIER_RE = re.compile(r"\b(?:nationwide|national|administrative|insurance|po
 HEADING_SRC_RE = re.compile(r"(?m)^(?:data\s+source|data\s+type|data\s+sources?)\s*[:\-]?\s*", re.I)
 TRAP_RE = re.compile(r"\b(?:datatable|database\s+software|sql\s+database)\b", re.I)
 TIGHT_TEMPLATE_RE = re.compile(r"(?:nationwide|insurance|administrative|ehr(?:-derived)?|registry|survey)\s+(?:claims?|records?|data|database)[^\.\n]{0,60}", re.I)
+EHR_RE = re.compile(r"\behr\b", re.I)
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int, int, str]]:
     token_spans = _token_spans(text)
@@ -82,7 +83,7 @@ def find_data_source_type_v4(text: str, window: int = 3):
 
 def find_data_source_type_v5(text: str):
     matches = _collect([TIGHT_TEMPLATE_RE], text)
-    out = [m for m in matches if QUALIFIER_RE.search(m[2]) or re.search(r"\behr\b", m[2], re.I)]
+    out = [m for m in matches if QUALIFIER_RE.search(m[2]) or EHR_RE.search(m[2])]
     return out
 
 DATA_SOURCE_TYPE_FINDERS: Dict[str, Callable[[str], List[Tuple[int,int,str]]]] = {
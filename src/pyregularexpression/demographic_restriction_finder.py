@@ -24,7 +24,7 @@ def _char_span_to_word_span(char_span: Tuple[int, int], token_spans: Sequence[Tu
     """Convert a character slice to the *inclusive* token‑index span that covers it."""    
     s_char, e_char = char_span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -45,6 +45,11 @@ DESC_STATS_RE = re.compile(r"\b(?:mean|average|median)\b", re.I)
 
 HEADING_DEMO_RE = re.compile(r"(?m)^(?:eligibility|inclusion|exclusion|participant[s]?|study\s+population)\s*[:\-]?\s*$", re.I)
 
+TIGHT_TEMPLATE_RE = re.compile(
+    rf"(?:participants?|patients?|subjects?)\s+(?:had\s+to\s+be|were|must\s+be|were\s+eligible\s+if|were\s+restricted\s+to|included\s+only)\s+(?:[^\n\.;]{{0,25}}?)?(?:{DEMOGRAPHIC_TERM_RE.pattern}|{AGE_COMPARISON_RE.pattern})",
+    re.I,
+)
+
 # ─────────────────────────────
 # 2.  Helper for collection
 # ─────────────────────────────
@@ -112,11 +117,7 @@ def find_demographic_restriction_v4(text: str, window: int = 5) -> List[Tuple[in
 
 def find_demographic_restriction_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5: tight template – participants/patients had to be … (high precision)."""    
-    TEMPLATE_RE = re.compile(
-        rf"(?:participants?|patients?|subjects?)\s+(?:had\s+to\s+be|were|must\s+be|were\s+eligible\s+if|were\s+restricted\s+to|included\s+only)\s+(?:[^\n\.;]{{0,25}}?)?(?:{DEMOGRAPHIC_TERM_RE.pattern}|{AGE_COMPARISON_RE.pattern})",
-        re.I,
-    )
-    return _collect([TEMPLATE_RE], text)
+    return _collect([TIGHT_TEMPLATE_RE], text)
 
 # ─────────────────────────────
 # 4.  Public mapping & exports
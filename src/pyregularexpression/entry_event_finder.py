@@ -19,7 +19,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(char_span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = char_span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # Regex assets -------------------------------------------------------------
@@ -62,6 +62,17 @@ TRAP_RE = re.compile(
     r")",
     re.I
 )
+BLOCK_CONTENT_RE = re.compile(r"([\s\n]*)(\S.*)", re.DOTALL)
+INLINE_HEADING_RE = re.compile(
+    r"(?i)\b(cohort\s+entry|entry\s+event|qualifying\s+event|index\s+event)\b[ \t]*[:\-\u2013][ \t]*(\S.+)"
+)
+BLOCK_HEADING_RE = re.compile(
+    r"(?im)^(cohort\s+entry|entry\s+event|qualifying\s+event|index\s+event)\s*[:\-\u2013]?\s*$"
+)
+TIGHT_TEMPLATE_RE = re.compile(
+    r"entry\s+event\s+was\s+(?:the\s+)?first\s+(?:[a-z]+\s+){0,4}?(diagnosis|hospitali[sz]ation|admission|event|infarction|visit)\b.*?[.?!]?",
+    re.I,
+)
 
 # Helper -------------------------------------------------------------------
 def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int, int, str]]:
@@ -110,9 +121,6 @@ def find_entry_event_v3(text: str):
     blocks = []
 
     # 1. Inline headings with content on the same line
-    INLINE_HEADING_RE = re.compile(
-        r"(?i)\b(cohort\s+entry|entry\s+event|qualifying\s+event|index\s+event)\b[ \t]*[:\-\u2013][ \t]*(\S.+)"
-    )
     for m in INLINE_HEADING_RE.finditer(text):
     # Cover full line
         line_start = text.rfind('\n', 0, m.start(2)) + 1
@@ -122,16 +130,12 @@ def find_entry_event_v3(text: str):
         blocks.append((line_start, line_end))
 
     # 2. Block headings with content below (allow 0 or 1 blank lines)
-    BLOCK_HEADING_RE = re.compile(
-##        r"(?im)^(cohort\s+entry|entry\s+event|qualifying\s+event|index\s+event)\s*[:\-]?\s*$"
-        r"(?im)^(cohort\s+entry|entry\s+event|qualifying\s+event|index\s+event)\s*[:\-\u2013]?\s*$"
-    )
     for h in BLOCK_HEADING_RE.finditer(text):
         heading_end = h.end()
         after = text[heading_end:]
         if after.startswith("\n\n\n"):
             continue
-        match = re.match(r"([\s\n]*)(\S.*)", after, re.DOTALL)
+        match = BLOCK_CONTENT_RE.match(after)
         if not match:
             continue
         gap, content = match.groups()
@@ -168,11 +172,7 @@ def find_entry_event_v4(text: str, window: int = 6):
     return out
 
 def find_entry_event_v5(text: str):
-    TEMPLATE_RE = re.compile(
-        r"entry\s+event\s+was\s+(?:the\s+)?first\s+(?:[a-z]+\s+){0,4}?(diagnosis|hospitali[sz]ation|admission|event|infarction|visit)\b.*?[.?!]?",
-        re.I,
-    )
-    return _collect([TEMPLATE_RE], text)
+    return _collect([TIGHT_TEMPLATE_RE], text)
 
 # Mapping ------------------------------------------------------------------
 ENTRY_EVENT_FINDERS: Dict[str, Callable[[str], List[Tuple[int, int, str]]]] = {
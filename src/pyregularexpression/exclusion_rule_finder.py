@@ -11,6 +11,7 @@ All functions return a list of tuples: (start_token_idx, end_token_idx, matched_
 from __future__ import annotations
 import re
 from typing import List, Tuple, Sequence, Dict, Callable
+from pyregularexpression._finder_core import cached_finder as _cached_finder
 
 # ─────────────────────────────
 # 0.  Shared utilities
@@ -24,7 +25,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -65,6 +66,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int,
 # ─────────────────────────────
 # 3.  Finder variants
 # ─────────────────────────────
+@_cached_finder
 def find_exclusion_rule_v1(text: str) -> List[Tuple[int, int, str]]:
     """Tier 1 – high recall: any exclusion/‘not eligible’ cue, filters nearby traps."""
     token_spans = _token_spans(text)
@@ -79,6 +81,7 @@ def find_exclusion_rule_v1(text: str) -> List[Tuple[int, int, str]]:
 
     return out
 
+@_cached_finder
 def find_exclusion_rule_v2(text: str, window: int = 5) -> List[Tuple[int, int, str]]:
     """Tier 2 – cue + gating token (‘if’, ‘only’, ':') nearby."""
     token_spans = _token_spans(text)
@@ -101,6 +104,7 @@ def find_exclusion_rule_v2(text: str, window: int = 5) -> List[Tuple[int, int, s
             continue
     return out
 
+@_cached_finder
 def find_exclusion_rule_v3(text: str, block_chars: int = 400) -> List[Tuple[int, int, str]]:
     """Tier 3 – only inside ‘Exclusion criteria’ heading blocks."""
     token_spans = _token_spans(text)
@@ -118,6 +122,7 @@ def find_exclusion_rule_v3(text: str, block_chars: int = 400) -> List[Tuple[int,
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_exclusion_rule_v4(text: str) -> List[Tuple[int, int, str]]:
     """Tier 4 – v2 + explicit negative conditional verbs, excludes follow‑up traps."""
     token_spans = _token_spans(text)
@@ -132,6 +137,7 @@ def find_exclusion_rule_v4(text: str) -> List[Tuple[int, int, str]]:
                 out.append((w_s, w_e, " ".join(tokens[w_s:w_e])))
     return out
 
+@_cached_finder
 def find_exclusion_rule_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5 – tight template (colon list or ‘excluded if’ sentence)."""
     return _collect([TIGHT_TEMPLATE_RE], text)
@@ -13,6 +13,7 @@ Each function returns a list of tuples: (start_token_idx, end_token_idx, matched
 from __future__ import annotations
 import re
 from typing import List, Tuple, Sequence, Dict, Callable
+from pyregularexpression._finder_core import cached_finder as _cached_finder
 
 # ─────────────────────────────
 # 0.  Shared utilities
@@ -25,7 +26,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -75,10 +76,12 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int,
 # ─────────────────────────────
 # 3.  Finder variants
 # ─────────────────────────────
+@_cached_finder
 def find_exit_criterion_v1(text: str) -> List[Tuple[int, int, str]]:
     """Tier 1 – any exit/censoring cue."""    
     return _collect([EXIT_CRITERION_TERM_RE], text)
 
+@_cached_finder
 def find_exit_criterion_v2(text: str, window: int = 5) -> List[Tuple[int, int, str]]:
     """Tier 2 – exit cue + temporal keyword within ±window tokens."""    
     token_spans = _token_spans(text)
@@ -93,6 +96,7 @@ def find_exit_criterion_v2(text: str, window: int = 5) -> List[Tuple[int, int, s
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_exit_criterion_v3(text: str, block_chars: int = 400) -> List[Tuple[int, int, str]]:
     """Tier 3 – only inside ‘Exit criteria / Censoring’ heading blocks."""    
     token_spans = _token_spans(text)
@@ -110,6 +114,7 @@ def find_exit_criterion_v3(text: str, block_chars: int = 400) -> List[Tuple[int,
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_exit_criterion_v4(text: str, window: int = 8) -> List[Tuple[int, int, str]]:
     """Tier 4 – v2 + explicit event/time token."""    
     token_spans = _token_spans(text)
@@ -122,6 +127,7 @@ def find_exit_criterion_v4(text: str, window: int = 8) -> List[Tuple[int, int, s
             out.append((w_s, w_e, snip))
     return out
 
+@_cached_finder
 def find_exit_criterion_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5 – tight template form."""    
     return _collect([TIGHT_TEMPLATE_RE], text)
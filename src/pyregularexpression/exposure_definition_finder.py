@@ -14,6 +14,7 @@ Each function returns a list of tuples: (start_token_idx, end_token_idx, matched
 from __future__ import annotations
 import re
 from typing import List, Tuple, Sequence, Dict, Callable
+from pyregularexpression._finder_core import cached_finder as _cached_finder
 
 # ─────────────────────────────
 # 0.  Shared utilities
@@ -26,7 +27,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -71,6 +72,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int,
 # ─────────────────────────────
 # 3.  Finder variants
 # ─────────────────────────────
+@_cached_finder
 def find_exposure_definition_v1(text):
     if TRAP_RE.search(text):
         return []
@@ -82,6 +84,7 @@ def find_exposure_definition_v1(text):
             matches.append((i, i, t))
     return matches
 
+@_cached_finder
 def find_exposure_definition_v2(text: str, window: int = 8) -> List[Tuple[int, int, str]]:
     """Tier 2 – exposure cue + defining verb within ±window tokens, excluding negated verbs."""
     token_spans = _token_spans(text)
@@ -99,6 +102,7 @@ def find_exposure_definition_v2(text: str, window: int = 8) -> List[Tuple[int, i
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_exposure_definition_v3(text: str, block_chars: int = 400) -> List[Tuple[int, int, str]]:
     """Tier 3 – allow exposure threshold expressions inside Exposure Definition-style section blocks."""
     token_spans = _token_spans(text)
@@ -121,6 +125,7 @@ def find_exposure_definition_v3(text: str, block_chars: int = 400) -> List[Tuple
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_exposure_definition_v4(text: str, window: int = 6) -> List[Tuple[int, int, str]]:
     """Tier 4 – exposure cue + defining verb + numeric/time criterion all within window."""
     token_spans = _token_spans(text)
@@ -138,6 +143,7 @@ def find_exposure_definition_v4(text: str, window: int = 6) -> List[Tuple[int, i
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_exposure_definition_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5 – tight template form."""    
     return _collect([TIGHT_TEMPLATE_RE], text)
@@ -13,6 +13,7 @@ Each function returns a list of tuples: (start_token_idx, end_token_idx, matched
 from __future__ import annotations
 import re
 from typing import List, Tuple, Sequence, Dict, Callable
+from pyregularexpression._finder_core import cached_finder as _cached_finder
 
 # ─────────────────────────────
 # 0.  Shared utilities
@@ -25,7 +26,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -58,6 +59,8 @@ TIGHT_TEMPLATE_RE = re.compile(
     re.I,
 )
 
+FOR_AFTER_RE = re.compile(r"\s+for\b", re.I)
+
 # ─────────────────────────────
 # 2.  Helper
 # ─────────────────────────────
@@ -81,6 +84,7 @@ def _char_span_to_char_index(span: Tuple[int,int], text: str) -> int:
 # ─────────────────────────────
 # 3.  Finder variants
 # ─────────────────────────────
+@_cached_finder
 def find_follow_up_period_v1(text: str) -> List[Tuple[int,int,str]]:
     # Tier 1 – high recall, but if the entire text mentions a visit-trap, bail out immediately
     if TRAP_RE.search(text):
@@ -93,7 +97,7 @@ def find_follow_up_period_v1(text: str) -> List[Tuple[int,int,str]]:
         if TRAP_RE.search(snippet):
             continue
         # 2) If it’s exactly “followed”, require it to be followed by “for”
-        if snippet.lower() == 'followed' and not re.match(r"\s+for\b", text[m.end():], re.I):
+        if snippet.lower() == 'followed' and not FOR_AFTER_RE.match(text, m.end()):
             continue
         # 3) Map char indices to token indices, then record
         token_spans = _token_spans(text)
@@ -101,6 +105,7 @@ def find_follow_up_period_v1(text: str) -> List[Tuple[int,int,str]]:
         results.append((w_s, w_e, snippet))
     return results
 
+@_cached_finder
 def find_follow_up_period_v2(text: str, window: int = 5):
     token_spans = _token_spans(text)
     # find all durations anywhere in the text, map their start positions to word‑indices
@@ -118,6 +123,7 @@ def find_follow_up_period_v2(text: str, window: int = 5):
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_follow_up_period_v3(text: str, block_chars: int = 400):
     token_spans = _token_spans(text)
     # first locate and filter heading blocks
@@ -139,6 +145,7 @@ def find_follow_up_period_v3(text: str, block_chars: int = 400):
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_follow_up_period_v4(text: str, window: int = 6):
     token_spans = _token_spans(text)
     qual_spans = [(m.start(),m.end()) for m in QUALIFIER_RE.finditer(text)]
@@ -154,6 +161,7 @@ def find_follow_up_period_v4(text: str, window: int = 6):
             out.append((w_s, w_e, snip))
     return out
 
+@_cached_finder
 def find_follow_up_period_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5 – tight template form."""
     return _collect([TIGHT_TEMPLATE_RE], text)
@@ -19,17 +19,19 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a<e<=b)
     return w_s, w_e
 
 NUM_RE = r"\d+(?:\.\d+)?%?"
 NUM_TOKEN_RE = re.compile(r"^\d+(?:\.\d+)?%?$")
+NUM_PAT = re.compile(NUM_RE)
 AE_CUE_RE = re.compile(r"\b(?:adverse\s+events?|side\s+effects?|complications?)\b", re.I)
 GROUP_RE = re.compile(r"\b(?:treatment|intervention|placebo|control|arm|group|vs|versus|compared\s+to)\b", re.I)
 SEVERITY_RE = re.compile(r"\b(?:serious|severe|grade\s*[3-5]|grade\s*≥\s*3|no\s+serious)\b", re.I)
 HEAD_AE_RE = re.compile(r"(?m)^(?:harms?|adverse\s+events?|safety|tolerability)\s*[:\-]?\s*$", re.I)
 TIGHT_TEMPLATE_RE = re.compile(rf"{NUM_RE}\s+[^,;\n]+\s+vs\s+{NUM_RE}\s+[^,;\n]+;?\s+no\s+serious\s+events", re.I)
 TRAP_RE = re.compile(r"\bharm\b", re.I)
+CUE_NUM_RE = re.compile(rf"{AE_CUE_RE.pattern}[^\n]{{0,20}}{NUM_RE}", re.I)
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     spans = _token_spans(text)
@@ -42,14 +44,13 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_harms_adverse_event_v1(text: str):
-    pattern = re.compile(rf"{AE_CUE_RE.pattern}[^\n]{{0,20}}{NUM_RE}", re.I)
-    return _collect([pattern], text)
+    return _collect([CUE_NUM_RE], text)
 
 def find_harms_adverse_event_v2(text: str, window: int = 4):
     spans = _token_spans(text)
     tokens = [text[s:e] for s, e in spans]
     cue_matches = [m for m in AE_CUE_RE.finditer(text)]
-    num_matches = [m for m in re.finditer(NUM_RE, text)]
+    num_matches = [m for m in NUM_PAT.finditer(text)]
     grp_matches = [m for m in GROUP_RE.finditer(text)]
     out = []
     cue_idx = [_char_to_word((m.start(), m.end()), spans) for m in cue_matches]
@@ -8,8 +8,10 @@ Five variants (v1–v5):
 Each function returns tuples: (start_token_idx, end_token_idx, snippet).
 """
 from __future__ import annotations
+import functools
 import re
 from typing import List, Tuple, Sequence, Dict, Callable
+from pyregularexpression._finder_core import cached_finder as _cached_finder
 
 
 import unicodedata
@@ -27,13 +29,14 @@ def normalize_text(text: str) -> str:
 # ─────────────────────────────
 TOKEN_RE = re.compile(r"\S+")
 
-def _token_spans(text: str) -> List[Tuple[int, int]]:
-    return [(m.start(), m.end()) for m in TOKEN_RE.finditer(text)]
+@functools.lru_cache(maxsize=256)
+def _token_spans(text: str) -> Tuple[Tuple[int, int], ...]:
+    return tuple((m.start(), m.end()) for m in TOKEN_RE.finditer(text))
 
 def _char_to_word(span: Tuple[int, int], tokens: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(tokens) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(tokens))) if a < e <= b)
+    w_e = next(i for i, (a, b) in zip(range(len(tokens) - 1, -1, -1), reversed(tokens)) if a < e <= b)
     return w_s, w_e
 
 # ─────────────────────────────
@@ -47,6 +50,11 @@ QUALIFIER_RE = re.compile(r"\b(?:primary|secondary|tertiary|academic|community|t
 
 HEADING_SET_RE = re.compile(r"(?m)^(?:setting|healthcare\s+setting|study\s+setting|study\s+design|research\s+setting|care\s+setting|clinical\s+setting|service\s+setting)\s*[:\-]?\s*.*$", re.I)
 
+HEADING_BLOCK_RE = re.compile(r"(healthcare setting|study setting)\s*:\s*(.*?)(?:\n\s*\n|$)", re.I | re.S)
+
+# Cheap first stage for v5: every TIGHT_TEMPLATE_RE match ends in one of these.
+TIGHT_PREFILTER_RE = re.compile(r"inpatient|outpatient|primary|icu|hospital", re.I)
+
 GENERIC_TRAP_RE = re.compile(r"real[- ]?world\s+setting|setting\s+of\s+care", re.I)
 
 TIGHT_TEMPLATE_RE = re.compile(r"(?:(?:conducted|performed|carried\s+out)\s+in|data\s+from)\s+[^.\n]{0,80}?(?:inpatient\s+setting|outpatient\s+setting|primary[-\s]+care\s+clinics?|icu(?:\s+inpatient\s+setting)?|hospital(?:\s+ward)?)\b", re.I)
@@ -55,6 +63,12 @@ TIGHT_TEMPLATE_RE = re.compile(r"(?:(?:conducted|performed|carried\s+out)\s+in|d
 # 2. Helper
 # ─────────────────────────────
 
+@functools.lru_cache(maxsize=256)
+def _candidate_spans(text: str) -> Tuple[Tuple[int, int], ...]:
+    """Char spans of every facility term in (normalised) *text*, scanned once
+    and shared by v1, v2 and v4."""
+    return tuple(m.span() for m in FACILITY_RE.finditer(text))
+
 def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int, int, str]]:
     tok_spans = _token_spans(text)
     out = []
@@ -70,11 +84,21 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int,
 # 3. Finder tiers
 # ─────────────────────────────
 
+@_cached_finder
 def find_healthcare_setting_v1(text: str):
     """Tier 1 – any facility term."""
     text = normalize_text(text)  # Normalize the text first
-    return _collect([FACILITY_RE], text)
+    tok_spans = _token_spans(text)
+    out = []
+    for s, e in _candidate_spans(text):
+        snippet = text[s:e]
+        if GENERIC_TRAP_RE.search(snippet):
+            continue
+        w_s, w_e = _char_to_word((s, e), tok_spans)
+        out.append((w_s, w_e, snippet))
+    return out
 
+@_cached_finder
 def find_healthcare_setting_v2(text: str, window: int = 3):
     """Tier 2 – facility term + context word within ±window tokens."""
     text = normalize_text(text)  # Normalize the text first
@@ -82,19 +106,18 @@ def find_healthcare_setting_v2(text: str, window: int = 3):
     tokens = [text[s:e] for s, e in tok_spans]
     ctx_idx = {i for i, t in enumerate(tokens) if CONTEXT_RE.fullmatch(t)}
     out = []
-    for m in FACILITY_RE.finditer(text):
-        w_s, w_e = _char_to_word((m.start(), m.end()), tok_spans)
+    for s, e in _candidate_spans(text):
+        w_s, w_e = _char_to_word((s, e), tok_spans)
         if any(c for c in ctx_idx if w_s - window <= c <= w_e + window):
-            out.append((w_s, w_e, m.group(0)))
+            out.append((w_s, w_e, text[s:e]))
     return out
 
+@_cached_finder
 def find_healthcare_setting_v3(text: str):
     text_norm = normalize_text(text)
-    print("Normalized text:", text_norm)
     blocks = []
-    for match in re.finditer(r"(healthcare setting|study setting)\s*:\s*(.*?)(?:\n\s*\n|$)", text_norm, re.I | re.S):
+    for match in HEADING_BLOCK_RE.finditer(text_norm):
         blocks.append((match.start(), match.end()))
-    print("Found blocks:", blocks)
     matches = []
     for start, end in blocks:
         block_text = text_norm[start:end]
@@ -102,6 +125,7 @@ def find_healthcare_setting_v3(text: str):
             matches.append(fac)
     return matches
 
+@_cached_finder
 def find_healthcare_setting_v4(text: str, window: int = 4):
     """Tier 4 – v2 + qualifier token near facility term."""
     text = normalize_text(text)  # Normalize the text first
@@ -117,9 +141,12 @@ def find_healthcare_setting_v4(text: str, window: int = 4):
             out.append((w_s, w_e, snip))
     return out
 
+@_cached_finder
 def find_healthcare_setting_v5(text: str):
     """Tier 5 – tight template."""
     text = normalize_text(text)  # Normalize the text first
+    if not TIGHT_PREFILTER_RE.search(text):
+        return []
     return _collect([TIGHT_TEMPLATE_RE], text)
 
 
@@ -23,7 +23,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -40,6 +40,8 @@ HEADING_INCL_RE = re.compile(r"(?m)^(?:inclusion\s+criteria|eligibility\s+criter
 
 TRAP_RE = re.compile(r"\b(?:study\s+included|analysis\s+included|included\s+patients|patients\s+included)\b", re.I)
 
+CONDITIONAL_VERB_RE = re.compile(r"\b(?:must\s+have|required\s+to\s+have|had\s+to\s+have|must\s+possess)\b", re.I)
+
 TIGHT_TEMPLATE_RE = re.compile(
     r"(?:inclusion\s+criteria:\s+[^\.\n]{0,120}|patients?\s+were\s+eligible\s+if\s+[^\.\n]{0,120})",
     re.I,
@@ -128,7 +130,6 @@ def find_inclusion_rule_v3(text: str, block_chars: int = 400):
 
 def find_inclusion_rule_v4(text: str, window: int = 6):
     """Tier 4 – v2 + explicit conditional verbs, excludes traps."""
-    CONDITIONAL_VERB_RE = re.compile(r"\b(?:must\s+have|required\s+to\s+have|had\s+to\s+have|must\s+possess)\b", re.I)
     token_spans = _token_spans(text)
     
     # Corrected logic to find all conditional verb tokens
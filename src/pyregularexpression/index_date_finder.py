@@ -22,7 +22,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -38,6 +38,11 @@ HEADING_INDEX_RE = re.compile(r"(?m)^(?:index\s+date|baseline\s+date|time\s+zero
 
 TRAP_RE = re.compile(r"\b(?:index\s+(?:case|test|patient|event)|follow(?:ed|ing)?\s+from|data\s+entry)\b", re.I)
 
+TIGHT_TEMPLATE_RE = re.compile(
+    r"(?:index\s+date|baseline\s+date)\s*(?:=|was\s+defined\s+as|was\s+set\s+as|was\s+assigned\s+as)\s+[^\.\;\n]{0,50}",
+    re.I,
+)
+
 # ─────────────────────────────
 # 2.  Helper
 # ─────────────────────────────
@@ -104,11 +109,7 @@ def find_index_date_v4(text: str, window: int = 5):
 
 def find_index_date_v5(text: str):
     """Tier 5 – tight template with '=' or 'was defined as'."""
-    TEMPLATE_RE = re.compile(
-        r"(?:index\s+date|baseline\s+date)\s*(?:=|was\s+defined\s+as|was\s+set\s+as|was\s+assigned\s+as)\s+[^\.\;\n]{0,50}",
-        re.I,
-    )
-    return _collect([TEMPLATE_RE], text)
+    return _collect([TIGHT_TEMPLATE_RE], text)
 
 # ─────────────────────────────
 # 4.  Public mapping & exports
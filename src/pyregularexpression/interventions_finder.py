@@ -19,7 +19,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(spans))) if a < e <= b)
+    w_e = next(i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b)
     return w_s, w_e
 
 ARM_CUE_RE = re.compile(r"\b(?:intervention|treatment|experimental|control|placebo|comparison|standard\s+care|usual\s+care)\s+(?:arm|group)\b", re.I)
@@ -27,6 +27,7 @@ ACTION_RE = re.compile(r"\b(?:received|were\s+given|was\s+given|treated\s+with|a
 AGENT_RE = re.compile(r"\b(?:placebo|dose|dosage|mg|g|mcg|units?|tablet|capsule|surgery|procedure|program|therapy|exercise|aerobic|drug|medication|vaccine)\b", re.I)
 CONTROL_CUE_RE = re.compile(r"\b(?:control\s+group|placebo\s+group|usual\s+care|standard\s+care|sham)\b", re.I)
 HEADING_INT_RE = re.compile(r"(?m)^(?:interventions?|treatments?|experimental\s+design|study\s+arms?)\s*[:\-]?\s*(.*)$", re.I)
+ARM_PHRASE_RE = re.compile(r"(?:intervention\s+group\s+received|treatment\s+group\s+received|treated\s+with|control\s+group\s+(?:was\s+given|received)|assigned\s+to\s+[A-Za-z])", re.I)
 TRAP_RE = re.compile(r"\bpolicy\s+interventions?|government\s+interventions?|intervention\s+strategies\s+were\s+discussed\b", re.I)
 TIGHT_TEMPLATE_RE = re.compile(r"\bexperimental\s+arm\s+[^\.\n]{0,120}?\breceived\b[^\.\n]{0,120}?(?:control|placebo|usual\s+care)\s+arm\s+[^\.\n]{0,120}?\b(?:received|continued)\b", re.I)
 
@@ -42,8 +43,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_interventions_v1(text: str):
-    cue_re = re.compile(r"(?:intervention\s+group\s+received|treatment\s+group\s+received|treated\s+with|control\s+group\s+(?:was\s+given|received)|assigned\s+to\s+[A-Za-z])", re.I)
-    return _collect([cue_re], text)
+    return _collect([ARM_PHRASE_RE], text)
 
 def find_interventions_v2(text: str, window: int = 4):
     spans = _token_spans(text)
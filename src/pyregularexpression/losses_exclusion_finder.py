@@ -19,16 +19,18 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a<e<=b)
     return w_s,w_e
 
 NUM_RE = r"\d{1,4}"
 NUM_TOKEN_RE = re.compile(r"^\d{1,4}$")
+NUM_PAT = re.compile(NUM_RE)
 LOSS_CUE_RE = re.compile(r"\b(?:lost\s+to\s+follow[- ]up|withdrew|withdrawn|dropped?\s+out|drop[- ]outs?|excluded\s+from\s+analysis|missing\s+data)\b", re.I)
 STAGE_RE = re.compile(r"\b(?:follow[- ]up|analysis|study\s+period|treatment|intervention)\b", re.I)
 REASON_RE = re.compile(r"\b(?:due\s+to|because\s+of|adverse\s+event|side\s+effects?|pregnancy)\b", re.I)
 HEAD_LOSS_RE = re.compile(r"(?m)^(?:losses?\s+and\s+exclusions?|drop[- ]?outs?|participant\s+flow)\s*[:\-]?.*$", re.I)
 TIGHT_TEMPLATE_RE = re.compile(rf"{NUM_RE}\s+lost\s+to\s+follow[- ]up,?\s+{NUM_RE}\s+withdrew\s+(?:due\s+to|because\s+of)\s+[^\.\n]+", re.I)
+NUM_LOSS_RE = re.compile(rf"{NUM_RE}[^\n]{{0,15}}{LOSS_CUE_RE.pattern}", re.I)
 TRAP_RE = re.compile(r"\bexcluded\s+during\s+screening|lost\s+samples?|specimens\b", re.I)
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str):
@@ -43,8 +45,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_losses_exclusion_v1(text: str):
-    pattern = re.compile(rf"{NUM_RE}[^\n]{{0,15}}{LOSS_CUE_RE.pattern}", re.I)
-    return _collect([pattern], text)
+    return _collect([NUM_LOSS_RE], text)
 
 def find_losses_exclusion_v2(text: str, window: int = 4):
     spans = _token_spans(text)
@@ -56,7 +57,7 @@ def find_losses_exclusion_v2(text: str, window: int = 4):
         start_idx = max(0, w_s_cue - window)
         end_idx = min(len(tokens), w_e_cue + window + 1)
         snippet = " ".join(tokens[start_idx:end_idx])
-        if re.search(NUM_RE, snippet) and STAGE_RE.search(snippet):
+        if NUM_PAT.search(snippet) and STAGE_RE.search(snippet):
             out.append((start_idx, end_idx-1, snippet))
     return out
 
@@ -85,7 +86,7 @@ def find_losses_exclusion_v4(text: str, window: int = 6):
         start_idx = max(0, w_s_cue - window)
         end_idx = min(len(tokens), w_e_cue + window + 1)
         snippet = " ".join(tokens[start_idx:end_idx])
-        if re.search(NUM_RE, snippet) and REASON_RE.search(snippet):
+        if NUM_PAT.search(snippet) and REASON_RE.search(snippet):
             out.append((start_idx, end_idx-1, snippet))
     return out
 
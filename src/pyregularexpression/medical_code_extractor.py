@@ -17,6 +17,8 @@ Extract medical codes from the given text.
 
 import re
 
+from pyregularexpression._finder_core import for_text as _for_text
+
 medical_code_pattern = {
     "ICD-10-CM":     re.compile(r"\b[A-Z]\d{2}\.\d{1,4}\b"),
     "ICD-10 sub":    re.compile(r"\b[A-Z]\d{2}\.[A-Z]\d{1,3}\b"),
@@ -30,6 +32,18 @@ medical_code_pattern = {
     "ATC":           re.compile(r"\b[A-Z]\d{2}[A-Z]{2}\d{2}\b"),
 }
 
+# punctuation a system's codes always contain; skip its scan when absent
+REQUIRED_CHAR = {
+    "ICD-10-CM": ".", "ICD-10 sub": ".", "ICD-9 numeric": ".", "ICD-9 V/E": ".",
+    "LOINC": "-", "NDC": "-",
+}
+
+# split only ICD-10 adjacency ("E11.9J09.X1" -> "E11.9 J09.X1")
+ICD10_ADJACENT_RE = re.compile(r"(?<=\.\d)(?=[A-Z])")
+FIVE_DIGIT_RE = re.compile(r"\d{5}")
+# every supported code system needs at least one digit
+DIGIT_RE = re.compile(r"\d")
+
 def extract_medical_codes(
     text: str, return_offsets: bool = False, unique: bool = False
 ):
@@ -42,12 +56,17 @@ def extract_medical_codes(
     Returns:
         A list of strings (codes) or a list of tuples (offsets).
     """
+    if not DIGIT_RE.search(text):
+        return []
+
     # split only ICD-10 adjacency
-    text = re.sub(r"(?<=\.\d)(?=[A-Z])", " ", text)
+    text = ICD10_ADJACENT_RE.sub(" ", text)
 
     matches = []
     for system, pat in medical_code_pattern.items():
-        for m in pat.finditer(text):
+        if system in REQUIRED_CHAR and REQUIRED_CHAR[system] not in text:
+            continue
+        for m in _for_text(pat, text).finditer(text):
             code = m.group(0)
 
             # drop ICD‑9 > 999.9
@@ -55,7 +74,7 @@ def extract_medical_codes(
                 continue
 
             # skip short SNOMED so CPT gets precedence
-            if system == "SNOMED" and re.fullmatch(r"\d{5}", code):
+            if system == "SNOMED" and FIVE_DIGIT_RE.fullmatch(code):
                 continue
 
             matches.append({"start": m.start(), "end": m.end(), "code": code})
@@ -17,7 +17,7 @@ def _char_span_to_word_span(char_span: Tuple[int, int], token_spans: Sequence[Tu
     """Convert a character slice to the **inclusive** word‑index span that covers it."""    
     s_char, e_char = char_span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
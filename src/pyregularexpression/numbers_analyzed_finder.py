@@ -19,7 +19,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a<e<=b)
     return w_s, w_e
 
 NUM_RE = r"\d{1,5}"
@@ -30,6 +30,7 @@ GROUP_RE = re.compile(r"\b(?:treatment|intervention|placebo|control|arm|group|co
 POP_RE = re.compile(r"\b(?:intention[- ]to[- ]treat|itt|per[- ]protocol|pp|safety\s+set)\b", re.I)
 HEAD_COUNT_RE = re.compile(r"(?m)^(?:numbers?\s+analys(?:ed|ed)|analysis\s+population|participants?\s+analys(?:ed|is))\s*[:\-]?\s*$", re.I)
 TIGHT_TEMPLATE_RE = re.compile(rf"{NUM_RE}\s+[^ ,;]+\s+and\s+{NUM_RE}\s+[^ ,;]+\s+participants?\s+analys(?:ed|is).*?(?:itt|intention[- ]to[- ]treat)", re.I)
+CUE_NUM_RE = re.compile(rf"(?:{ANALYZE_CUE_RE.pattern}|{N_EQUALS_RE.pattern})(?:[^\n]{{0,15}}{NUM_RE})?", re.I)
 TRAP_RE = re.compile(r"\benrolled|recruited|randomi[sz]ed\b", re.I)
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str):
@@ -44,8 +45,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_numbers_analyzed_v1(text: str):
-    pattern = re.compile(rf"(?:{ANALYZE_CUE_RE.pattern}|{N_EQUALS_RE.pattern})(?:[^\n]{{0,15}}{NUM_RE})?", re.I)
-    return _collect([pattern], text)
+    return _collect([CUE_NUM_RE], text)
 
 def find_numbers_analyzed_v2(text: str, window: int = 4):
     spans = _token_spans(text)
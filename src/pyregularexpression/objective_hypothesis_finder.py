@@ -23,7 +23,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(spans))) if a < e <= b)
+    w_e = next(i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b)
     return w_s, w_e
 
 # ─────────────────────────────
@@ -34,6 +34,7 @@ OBJ_CUE_RE = re.compile(
     re.I | re.UNICODE,
 )
 HYP_CUE_RE = re.compile(r"\bwe\s+hypothes(?:is|iz)(?:e|ed)?\s+that\b", re.I)
+VERB_RE = re.compile(r"\b(?:was|were|is|are|aim(?:ed)?|hypothes(?:is|iz)(?:e|ed)?)\b", re.I)
 STUDY_TOKEN_RE = re.compile(r"\b(?:study|this study)\b", re.I)
 HEADING_OBJ_RE = re.compile(r"(?m)^(?:objectives?|aims?|purpose|study\s+aims?)\s*[:\-]?\s*$", re.I)
 TRAP_RE = re.compile(r"\bobjective\s+(?:measurement|value)|aim\s+for|objective\s+function\b", re.I)
@@ -67,8 +68,7 @@ def find_objective_hypothesis_v2(text: str, window: int = 3):
     """Tier 2 – cue + verb tense OR hypothesis phrase."""
     spans = _token_spans(text)
     tokens = [text[s:e] for s, e in spans]
-    verb_re = re.compile(r"\b(?:was|were|is|are|aim(?:ed)?|hypothes(?:is|iz)(?:e|ed)?)\b", re.I)
-    verb_idx = {i for i, t in enumerate(tokens) if verb_re.fullmatch(t)}
+    verb_idx = {i for i, t in enumerate(tokens) if VERB_RE.fullmatch(t)}
     out = []
     for m in OBJ_CUE_RE.finditer(text):
         w_s, w_e = _char_to_word((m.start(), m.end()), spans)
@@ -23,7 +23,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next((i for i, (s, e) in enumerate(token_spans) if e > s_char), 0)
-    w_end   = next((i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char), len(token_spans)-1)
+    w_end   = next((i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char), len(token_spans)-1)
     return w_start, w_end
 
 OUTCOME_CUE_RE = re.compile(r"\b(?:outcomes?|endpoints?)\b", re.I)
@@ -32,6 +32,8 @@ CRITERION_TOKEN_RE = re.compile(r"\b(?:within\s+\d+\s*(?:day|week|month|year)s?|
 HEADING_OUTCOME_RE = re.compile(r"(?m)^(?:outcome\s+definition|endpoint\s+definition|primary\s+outcome|outcomes?)\s*[:\-]?\s*$", re.I)
 TRAP_RE = re.compile(r"\b(?:outcomes?\s+were|overall\s+outcome|secondary\s+analysis|result|positive\s+outcome)\b", re.I)
 TIGHT_TEMPLATE_RE = re.compile(r"(?:primary\s+)?(?:outcome|endpoint)\s*(?:was\s+defined\s+as|:)\s+[^\.\n]{0,100}", re.I)
+EMPTY_BLOCK_RE = re.compile(r"(not specified\.?|\(no outcome reported\))", re.I)
+VAGUE_RE = re.compile(r"\bvague\b", re.I)
 
 def _collect(patterns, text):
     token_spans = _token_spans(text)
@@ -78,7 +80,7 @@ def find_outcome_definition_v3(text: str, block_chars: int = 400):
         nb = text.find("\n\n", start)
         end = nb if 0 <= nb - start <= block_chars else min(len(text), start + block_chars)
         block_text = text[start:end].strip()
-        if block_text and not TRAP_RE.search(block_text) and not re.fullmatch(r"(not specified\.?|\(no outcome reported\))", block_text, re.I):
+        if block_text and not TRAP_RE.search(block_text) and not EMPTY_BLOCK_RE.fullmatch(block_text):
             w_start, w_end = _char_span_to_word_span((start, end), token_spans)
             matches.append((w_start, w_end, block_text))
     return matches
@@ -92,7 +94,7 @@ def find_outcome_definition_v4(text: str, window: int = 6):
         start = max(0, w_s - window)
         end = min(len(tokens) - 1, w_e + window)
         window_text = " ".join(tokens[start:end+1])
-        if CRITERION_TOKEN_RE.search(window_text) and not re.search(r"\bvague\b", window_text, re.I):
+        if CRITERION_TOKEN_RE.search(window_text) and not VAGUE_RE.search(window_text):
             out.append((w_s, w_e, snippet))
     return out
 
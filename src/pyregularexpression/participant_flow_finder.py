@@ -19,7 +19,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a<e<=b)
     return w_s, w_e
 
 NUM_RE = r"\d{1,4}"
@@ -30,6 +30,7 @@ HEADING_FLOW_RE = re.compile(r"(?m)^(?:participant\s+flow|consort\s+flow|figure\
 TRAP_RE = re.compile(r"\btotal\s+of\s+\d+\b", re.I)
 TIGHT_TEMPLATE_RE = re.compile(rf"{NUM_RE}\s+randomi[sz]ed\s*\(\s*{NUM_RE}\s+[^,]+,\s*{NUM_RE}\s+[^\)]+\)\s*;\s*{NUM_RE}\s+completed", re.I)
 NUM_TOKEN_RE = re.compile(r"^\d{1,4}$")
+FLOW_CUE_NUM_RE = re.compile(rf"{FLOW_CUE_RE.pattern}[^\n]{{0,15}}{NUM_RE}", re.I)
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     spans = _token_spans(text)
@@ -43,8 +44,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_participant_flow_v1(text:str):
-    pattern = re.compile(rf"{FLOW_CUE_RE.pattern}[^\n]{{0,15}}{NUM_RE}", re.I)
-    return _collect([pattern], text)
+    return _collect([FLOW_CUE_NUM_RE], text)
 
 def find_participant_flow_v2(text: str, window: int = 4):
     spans = _token_spans(text)
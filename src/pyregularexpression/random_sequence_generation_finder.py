@@ -8,18 +8,22 @@ Five variants (v1–v5):
 Each finder returns (start_word_idx, end_word_idx, snippet).
 """
 from __future__ import annotations
+import functools
 import re
-from typing import List, Tuple, Sequence, Dict, Callable
+from bisect import bisect_right
+from typing import List, Tuple, Sequence, Dict, Callable, FrozenSet
+from pyregularexpression._finder_core import cached_finder as _cached_finder
 
 TOKEN_RE = re.compile(r"\S+")
 
-def _token_spans(text:str)->List[Tuple[int,int]]:
-    return [(m.start(), m.end()) for m in TOKEN_RE.finditer(text)]
+@functools.lru_cache(maxsize=256)
+def _token_spans(text:str)->Tuple[Tuple[int,int],...]:
+    return tuple((m.start(), m.end()) for m in TOKEN_RE.finditer(text))
 
 def _char_to_word(span:Tuple[int,int], spans:Sequence[Tuple[int,int]]):
     s,e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a < e <= b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b)
     return w_s, w_e
 
 GEN_CUE_RE = re.compile(r"\b(?:computer[- ]?generated|computerised|computerized|random\s+number\s+table|coin\s+toss|shuffled\s+(?:opaque\s+)?envelopes?|sealed\s+opaque\s+envelopes?|permuted\s+block|block\s+randomi[sz]ation|stratified\s+randomi[sz]ation)\b", re.I)
@@ -32,6 +36,17 @@ TIGHT_TEMPLATE_RE = re.compile(
     re.I,
 )
 
+# Cheap first stage for v5: every TIGHT_TEMPLATE_RE match contains this.
+TIGHT_PREFILTER_RE = re.compile(r"block\s+randomi[sz]ation", re.I)
+
+@functools.lru_cache(maxsize=256)
+def _cue_and_key_indices(text:str)->Tuple[FrozenSet[int],FrozenSet[int]]:
+    """Indices of generation-cue and randomisation-keyword tokens, shared by v2 and v4."""
+    tokens=[text[s:e] for s,e in _token_spans(text)]
+    gen_idx=frozenset(i for i,t in enumerate(tokens) if GEN_CUE_RE.search(t))
+    key_idx=frozenset(i for i,t in enumerate(tokens) if RAND_KEY_RE.search(t))
+    return gen_idx, key_idx
+
 def _collect(patterns:Sequence[re.Pattern[str]], text:str):
     spans=_token_spans(text)
     out=[]
@@ -43,28 +58,42 @@ def _collect(patterns:Sequence[re.Pattern[str]], text:str):
             out.append((w_s,w_e,m.group(0)))
     return out
 
+@_cached_finder
 def find_random_sequence_generation_v1(text:str):
     return _collect([GEN_CUE_RE], text)
 
+@_cached_finder
 def find_random_sequence_generation_v2(text:str, window:int=4):
     spans=_token_spans(text)
-    tokens=[text[s:e] for s,e in spans]
-    key_idx={i for i,t in enumerate(tokens) if RAND_KEY_RE.search(t)}
-    gen_idx={i for i,t in enumerate(tokens) if GEN_CUE_RE.search(t)}
+    gen_idx,key_idx=_cue_and_key_indices(text)
     out=[]
     for i in gen_idx:
         if any(k for k in key_idx if abs(k-i)<=window):
             w_s,w_e=_char_to_word(spans[i],spans)
-            out.append((w_s,w_e,tokens[i]))
+            s,e=spans[i]
+            out.append((w_s,w_e,text[s:e]))
     return out
 
-def find_random_sequence_generation_v3(text:str, block_chars:int=400):
-    spans=_token_spans(text)
-    blocks=[]
+def _heading_blocks(text:str, block_chars:int)->Tuple[List[int],List[int]]:
+    """Heading blocks merged into disjoint, sorted (starts, ends)."""
+    starts,ends=[],[]
     for h in HEADING_RAND_RE.finditer(text):
         s=h.end(); e=min(len(text), s+block_chars)
-        blocks.append((s,e))
-    inside=lambda p:any(s<=p<e for s,e in blocks)
+        if ends and s<=ends[-1]:
+            ends[-1]=max(ends[-1],e)
+        else:
+            starts.append(s); ends.append(e)
+    return starts,ends
+
+@_cached_finder
+def find_random_sequence_generation_v3(text:str, block_chars:int=400):
+    block_starts,block_ends=_heading_blocks(text, block_chars)
+    if not block_starts:
+        return []
+    spans=_token_spans(text)
+    def inside(p:int)->bool:
+        i=bisect_right(block_starts,p)-1
+        return i>=0 and p<block_ends[i]
     out=[]
     for m in GEN_CUE_RE.finditer(text):
         if inside(m.start()):
@@ -72,6 +101,7 @@ def find_random_sequence_generation_v3(text:str, block_chars:int=400):
             out.append((w_s,w_e,m.group(0)))
     return out
 
+@_cached_finder
 def find_random_sequence_generation_v4(text:str, window:int=6):
     spans=_token_spans(text)
     tokens=[text[s:e] for s,e in spans]
@@ -83,7 +113,10 @@ def find_random_sequence_generation_v4(text:str, window:int=6):
             out.append((w_s,w_e,snip))
     return out
 
+@_cached_finder
 def find_random_sequence_generation_v5(text:str):
+    if not TIGHT_PREFILTER_RE.search(text):
+        return []
     return _collect([TIGHT_TEMPLATE_RE], text)
 
 RANDOM_SEQUENCE_GENERATION_FINDERS: Dict[str,Callable[[str],List[Tuple[int,int,str]]]] = {
@@ -9,6 +9,7 @@ Each function returns tuples: (start_word_idx, end_word_idx, snippet).
 """
 from __future__ import annotations
 import re
+from bisect import bisect_left, bisect_right
 from typing import List, Tuple, Sequence, Dict, Callable
 
 TOKEN_RE = re.compile(r"\S+")
@@ -20,7 +21,7 @@ def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b or (s <= a and s < b))
     w_e = next(
-        i for i, (a, b) in reversed(list(enumerate(spans)))
+        i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans))
         if a < e <= b or (a < e and e >= b)
     )
     return w_s, w_e
@@ -38,6 +39,9 @@ TRAP_RE = re.compile(r"\brandomly\s+assigned|random\s+sampling|random\s+effects?
 TIGHT_TEMPLATE_RE = re.compile(
     r"randomi[sz]ed\s+\d+:\d+\s+[^\.\n]{0,100}permuted\s+blocks?[^\.\n]{0,80}stratified\s+by", re.I
 )
+# literal anchors the template cannot match without; checked up front so the
+# bounded [^\.\n]{0,N} spans never get to backtrack on texts lacking them
+TIGHT_ANCHOR_RES = (re.compile(r"permuted\s+blocks?", re.I), re.compile(r"stratified\s+by", re.I))
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     spans = _token_spans(text)
@@ -56,7 +60,9 @@ def find_randomization_type_restriction_v1(text: str):
 def find_randomization_type_restriction_v2(text: str, window: int = 4):
     """Restriction cue + randomisation keyword within ±window tokens.
     Excludes cases where only ratio + randomisation is present (no real restriction cue)."""
-    spans = _token_spans(text)
+    return _v2_matches(text, _token_spans(text), window)
+
+def _v2_matches(text: str, spans: Sequence[Tuple[int, int]], window: int):
     key_spans = [(m.start(), m.end()) for m in RAND_KEY_RE.finditer(text)]
     restrict_spans = [(m.start(), m.end()) for m in RESTRICT_CUE_RE.finditer(text)]
     ratio_spans = [(m.start(), m.end()) for m in RATIO_RE.finditer(text)]
@@ -90,18 +96,23 @@ def find_randomization_type_restriction_v4(text: str, window: int = 6):
     """v2 plus explicit allocation ratio OR multiple modifiers (e.g., block + stratified)."""
     spans = _token_spans(text)
     tokens = [text[s:e] for s, e in spans]
-    ratio_idx = {i for i, t in enumerate(tokens) if RATIO_RE.fullmatch(t)}
-    mod_idx = {i for i, t in enumerate(tokens) if MODIFIER_RE.fullmatch(t)}
-    matches = find_randomization_type_restriction_v2(text, window=window)
+    # token indices come out of enumerate() already sorted → bisect windows
+    ratio_idx = [i for i, t in enumerate(tokens) if RATIO_RE.fullmatch(t)]
+    mod_idx = [i for i, t in enumerate(tokens) if MODIFIER_RE.fullmatch(t)]
+    matches = _v2_matches(text, spans, window)
     out = []
     for w_s, w_e, snip in matches:
-        mods_near = sum(1 for m in mod_idx if w_s - window <= m <= w_e + window)
-        ratio_near = any(r for r in ratio_idx if w_s - window <= r <= w_e + window)
+        lo, hi = w_s - window, w_e + window
+        mods_near = bisect_right(mod_idx, hi) - bisect_left(mod_idx, lo)
+        i = bisect_left(ratio_idx, lo)
+        ratio_near = i < len(ratio_idx) and ratio_idx[i] <= hi
         if ratio_near or mods_near >= 2:
             out.append((w_s, w_e, snip))
     return out
 
 def find_randomization_type_restriction_v5(text: str):
+    if not all(a.search(text) for a in TIGHT_ANCHOR_RES):
+        return []
     return _collect([TIGHT_TEMPLATE_RE], text)
 
 RANDOMIZATION_TYPE_RESTRICTION_FINDERS: Dict[str, Callable[[str], List[Tuple[int,int,str]]]] = {
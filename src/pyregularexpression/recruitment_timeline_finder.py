@@ -11,6 +11,8 @@ from __future__ import annotations
 import re
 from typing import List, Tuple, Sequence, Dict, Callable
 
+import numpy as np
+
 TOKEN_RE = re.compile(r"\S+")
 
 def _token_spans(text: str) -> List[Tuple[int, int]]:
@@ -19,7 +21,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
+    w_e = next(i for i,(a,b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a<e<=b)
     return w_s,w_e
 
 MONTHS = r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
@@ -35,6 +37,25 @@ TRAP_RE = re.compile(r"\bwas\s+challenging|difficult\s+to\s+recruit\b", re.I)
 
 DATE_TOKEN = re.compile(rf"^(?:{MONTHS}|{YEAR})$", re.I)
 RANGE_SEP = re.compile(r"^(?:–|—|-|to|through|until)$")
+# v2-v4 match date ranges case-sensitively, as re.search(DATE_RANGE_RE, ...) did
+DATE_RANGE_CS_PAT = re.compile(DATE_RANGE_RE)
+DATE_PAT = re.compile(DATE_RE)
+CUE_DATE_RE = re.compile(rf"{ENROL_CUE_RE.pattern}[^\n]{{0,20}}(?:{DATE_RANGE_RE}|{DATE_RE})", re.I)
+
+def _date_range_index(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Char (starts, ends) of every DATE_RANGE hit; both arrays are sorted."""
+    hits = [(m.start(), m.end()) for m in DATE_RANGE_CS_PAT.finditer(text)]
+    arr = np.array(hits, dtype=np.int64).reshape(-1, 2)
+    return arr[:, 0], arr[:, 1]
+
+def _has_range_within(lo: np.ndarray, hi: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Vectorised ``re.search(DATE_RANGE_RE, text[lo:hi])`` over many windows."""
+    if not len(starts):
+        return np.zeros(len(lo), dtype=bool)
+    i = np.searchsorted(starts, lo, side="left")
+    ok = i < len(starts)
+    i = np.minimum(i, len(starts) - 1)
+    return ok & (ends[i] <= hi)
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     spans = _token_spans(text)
@@ -48,19 +69,20 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_recruitment_timeline_v1(text: str):
-    pattern = re.compile(rf"{ENROL_CUE_RE.pattern}[^\n]{{0,20}}(?:{DATE_RANGE_RE}|{DATE_RE})", re.I)
-    return _collect([pattern], text)
+    return _collect([CUE_DATE_RE], text)
 
 def find_recruitment_timeline_v2(text: str, window: int = 6):
-    spans = _token_spans(text)
+    return _v2_matches(text, _token_spans(text), window)
+
+def _v2_matches(text: str, spans: Sequence[Tuple[int, int]], window: int):
     cue_matches = [_char_to_word((m.start(), m.end()), spans)
                    for m in ENROL_CUE_RE.finditer(text)]
-    out = []
-    for w_s, w_e in cue_matches:
-        snippet = text[spans[w_s][0]: spans[min(len(spans)-1, w_e+window)][1]]
-        if re.search(DATE_RANGE_RE, snippet):
-            out.append((w_s, w_e, snippet))
-    return out
+    if not cue_matches:
+        return []
+    lo = np.fromiter((spans[w_s][0] for w_s, _ in cue_matches), dtype=np.int64, count=len(cue_matches))
+    hi = np.fromiter((spans[min(len(spans)-1, w_e+window)][1] for _, w_e in cue_matches), dtype=np.int64, count=len(cue_matches))
+    keep = _has_range_within(lo, hi, *_date_range_index(text))
+    return [(w_s, w_e, text[a:b]) for (w_s, w_e), a, b, k in zip(cue_matches, lo.tolist(), hi.tolist(), keep.tolist()) if k]
 
 def find_recruitment_timeline_v3(text: str, block_chars: int = 500):
     spans = _token_spans(text)
@@ -76,14 +98,14 @@ def find_recruitment_timeline_v3(text: str, block_chars: int = 500):
             for s, e in blocks:
                 if s <= m.start() < e:
                     block_text = text[s:e]
-                    if re.search(DATE_RANGE_RE, block_text) or re.search(DATE_RE, block_text):
+                    if DATE_RANGE_CS_PAT.search(block_text) or DATE_PAT.search(block_text):
                         w_s, w_e = _char_to_word((m.start(), m.end()), spans)
                         out.append((w_s, w_e, m.group(0)))
     return out
 
 def find_recruitment_timeline_v4(text: str, window: int = 8):
     spans = _token_spans(text)
-    matches = find_recruitment_timeline_v2(text, window=window)
+    matches = _v2_matches(text, spans, window)
     out = []
     for w_s, w_e, snip in matches:
         snippet = text[spans[w_s][0]: spans[w_e][1] + 80]
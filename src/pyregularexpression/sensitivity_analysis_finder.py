@@ -23,7 +23,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -44,6 +44,10 @@ TIGHT_TEMPLATE_RE = re.compile(
     re.I,
 )
 
+# Both template branches contain this literal; without it the
+# [^\.\n]{0,60} span would only backtrack to fail.
+TIGHT_ANCHOR_RE = re.compile(r"sensitivity\s+analys(?:is|es)", re.I)
+
 
 # ─────────────────────────────
 # 2.  Helper
@@ -68,7 +72,9 @@ def find_sensitivity_analysis_v1(text: str) -> List[Tuple[int, int, str]]:
 
 def find_sensitivity_analysis_v2(text: str, window: int = 4) -> List[Tuple[int, int, str]]:
     """Tier 2 – sensitivity phrase + analysis verb within ±window tokens."""
-    token_spans = _token_spans(text)
+    return _v2_matches(text, _token_spans(text), window)
+
+def _v2_matches(text: str, token_spans: Sequence[Tuple[int, int]], window: int) -> List[Tuple[int, int, str]]:
     tokens = [text[s:e] for s, e in token_spans]
     verb_idx = {i for i, t in enumerate(tokens) if ANALYSIS_VERB_RE.search(t)}
     out: List[Tuple[int, int, str]] = []
@@ -82,8 +88,7 @@ def find_sensitivity_analysis_v3(text: str) -> list[tuple[int, int, str]]:
     """Detect sensitivity analysis phrases only inside heading blocks (generalized)."""
     token_spans = _token_spans(text)
     out: list[tuple[int, int, str]] = []
-    heading_re = re.compile(r"(?im)^\s*sensitivity\s+analys(?:is|es)\s*[:\-]?\s*$")
-    headings = list(heading_re.finditer(text))
+    headings = list(HEADING_SENS_RE.finditer(text))
     heading_positions = [h.start() for h in headings] + [len(text)]
     for i in range(len(headings)):
         start_block = headings[i].start()     
@@ -109,7 +114,7 @@ def find_sensitivity_analysis_v4(text: str, window: int = 6) -> List[Tuple[int,
     token_spans = _token_spans(text)
     tokens = [text[s:e] for s, e in token_spans]
     scen_idx = {i for i, t in enumerate(tokens) if SCENARIO_TOKEN_RE.fullmatch(t)}
-    matches = find_sensitivity_analysis_v2(text, window=window)
+    matches = _v2_matches(text, token_spans, window)
     out: List[Tuple[int, int, str]] = []
     for w_s, w_e, snip in matches:
         if any(scn for scn in scen_idx if w_s - window <= scn <= w_e + window):
@@ -118,6 +123,8 @@ def find_sensitivity_analysis_v4(text: str, window: int = 6) -> List[Tuple[int,
 
 def find_sensitivity_analysis_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5 – tight template."""
+    if not TIGHT_ANCHOR_RE.search(text):
+        return []
     return _collect([TIGHT_TEMPLATE_RE], text)
 
 # ─────────────────────────────
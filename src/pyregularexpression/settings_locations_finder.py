@@ -23,7 +23,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(spans))) if a < e <= b)
+    w_e = next(i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b)
     return w_s, w_e
 
 # --- Regex patterns ---
@@ -54,6 +54,11 @@ CUE_RE = re.compile(
     r"\b(?:conducted|performed|carried\s+out|undertaken|recruited|obtained|collected)\b",
     re.I
 )
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+STUDY_SETTING_RE = re.compile(
+    r"(?:study\s+settings?|research\s+setting|study\s+was\s+(?:conducted|performed|carried\s+out|undertaken))",
+    re.I
+)
 
 # --- Helper to collect matches ---
 def _collect(patterns: Sequence[re.Pattern[str]], text: str):
@@ -67,11 +72,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
 
 # Variant 1 – High recall: mentions of "settings" or "conducted" phrases
 def find_settings_location_v1(text: str):
-    pattern = re.compile(
-        r"(?:study\s+settings?|research\s+setting|study\s+was\s+(?:conducted|performed|carried\s+out|undertaken))",
-        re.I
-    )
-    matches = _collect([pattern], text)
+    matches = _collect([STUDY_SETTING_RE], text)
     filtered = []
     for w_s, w_e, snippet in matches:
         span_text = text.lower()
@@ -119,7 +120,7 @@ def find_settings_location_v4(text: str, window: int = 8):
     base_matches = find_settings_location_v2(text, window=window)
     if not base_matches:
         return []
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = SENTENCE_SPLIT_RE.split(text)
     out = []
     for w_s, w_e, snip in base_matches:
         for sent in sentences:
@@ -20,7 +20,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(spans))) if a < e <= b)
+    w_e = next(i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b)
     return w_s, w_e
 
 SIM_CUE_RE = re.compile(
@@ -49,7 +49,9 @@ def find_similarity_of_interventions_v1(text: str):
     return _collect([SIM_CUE_RE], text)
 
 def find_similarity_of_interventions_v2(text: str, window: int = 4):
-    spans = _token_spans(text)
+    return _v2_matches(text, _token_spans(text), window)
+
+def _v2_matches(text: str, spans: Sequence[Tuple[int, int]], window: int):
     tokens = [text[s:e] for s, e in spans]
     tokens_clean = [t.strip(string.punctuation) for t in tokens]
     form_idx = {i for i, t in enumerate(tokens_clean) if FORM_RE.fullmatch(t)}
@@ -78,7 +80,7 @@ def find_similarity_of_interventions_v4(text: str, window: int = 6):
     spans = _token_spans(text)
     tokens = [text[s:e] for s, e in spans]
     clean_tokens = [t.strip(string.punctuation) for t in tokens]
-    matches = find_similarity_of_interventions_v2(text, window=window)
+    matches = _v2_matches(text, spans, window)
     out = []
     for w_s, w_e, snip in matches:
         start = max(0, w_s - window)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass       # stdlib ≥3.7 :contentReference[oaicite:1]{index=1}
 from typing import Callable, Iterable, List, Tuple, Dict
-import bisect, functools, re
+import bisect, functools
+
+import numpy as np
+
+from pyregularexpression._finder_core import token_spans
 
 import nltk                             # relies on PunktSentenceTokenizer :contentReference[oaicite:2]{index=2}
 from nltk.tokenize import PunktSentenceTokenizer
@@ -25,22 +29,60 @@ class SplitResult:
         return (s for s, keep in zip(self.sentences, self.mask) if not keep)
 
 
-_TOKEN_RE = re.compile(r"\S+")
-
 @functools.lru_cache(maxsize=1)
 def _tokenizer() -> PunktSentenceTokenizer:
     return PunktSentenceTokenizer()
 
-def _token_spans(text: str) -> List[Tuple[int, int]]:
-    return [(m.start(), m.end()) for m in _TOKEN_RE.finditer(text)]
+def _token_starts(text: str) -> List[int]:
+    """Char offset of every \\S+ token, from the shared vectorised tokeniser."""
+    return token_spans(text)[0].tolist()
 
-def _sentence_data(text: str):
+@functools.lru_cache(maxsize=256)
+def _sentence_data(text: str) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """Punkt sentences and their start offsets, cached per text."""
     tok = _tokenizer()
     spans = list(tok.span_tokenize(text))
-    sents = [text[s:e] for s, e in spans]
-    starts = [s for s, _ in spans]
+    sents = tuple(text[s:e] for s, e in spans)
+    starts = tuple(s for s, _ in spans)
     return sents, starts
 
+def _scan(text: str, finders: Tuple[Callable[[str], List[Tuple[int, int, str]]], ...]):
+    """Sentences plus every finder hit as (sent_idx, finder_name, hit).
+
+    Independent of the context window, so repeat calls that only vary
+    window_back / window_fwd reuse the cached scan.
+    """
+    sentences, sent_start_chars = _sentence_data(text)
+    token_starts = _token_starts(text)
+
+    hits: List[Tuple[int, str, str]] = []
+    for finder in finders:
+        for w_start, _w_end, hit in finder(text):
+            if not 0 <= w_start < len(token_starts):
+                continue
+            char_pos = token_starts[w_start]
+            sent_idx = bisect.bisect_right(sent_start_chars, char_pos) - 1
+            if 0 <= sent_idx < len(sentences):
+                hits.append((sent_idx, finder.__name__, hit))
+    return sentences, tuple(hits)
+
+_cached_scan = functools.lru_cache(maxsize=256)(_scan)
+
+def _window_mask(hit_ix: Iterable[int], n: int, back: int, fwd: int) -> np.ndarray:
+    """Boolean mask of sentences within [hit - back, hit + fwd] of any hit.
+
+    Each window adds +1/-1 at its clipped ends of a difference array, so the
+    cost is O(hits + n) whatever the window size.
+    """
+    idx = np.fromiter(hit_ix, dtype=np.int64)
+    lo = np.maximum(idx - back, 0)
+    hi = np.minimum(idx + fwd + 1, n)
+    keep = lo < hi
+    diff = np.zeros(n + 1, dtype=np.int64)
+    np.add.at(diff, lo[keep], 1)
+    np.add.at(diff, hi[keep], -1)
+    return np.cumsum(diff[:n]) > 0
+
 # -------------------------------------------------------------------
 def split_text_by_filter(
     text: str,
@@ -52,34 +94,35 @@ def split_text_by_filter(
     if not text.strip():
         return SplitResult("", "", [], [], [], [])
 
-    sentences, sent_start_chars = _sentence_data(text)
-    token_spans = _token_spans(text)
-
-    matched_idx: set[int] = set()
-    hits: List[Tuple[int, str, str]] = []
+    finders = tuple(finder_funcs)
+    if finders:
+        # finder objects that define __eq__ without __hash__ fall back to a fresh scan
+        scan = _cached_scan if all(type(f).__hash__ is not None for f in finders) else _scan
+        sentences, hits = scan(text, finders)
+    else:
+        sentences, hits = _sentence_data(text)[0], ()
 
-    for finder in finder_funcs:
-        for w_start, _w_end, hit in finder(text):
-            if w_start >= len(token_spans):
-                continue
-            char_pos = token_spans[w_start][0]
-            sent_idx = bisect.bisect_right(sent_start_chars, char_pos) - 1
-            if 0 <= sent_idx < len(sentences):
-                lo = max(0, sent_idx - window_back)
-                hi = min(len(sentences), sent_idx + window_fwd + 1)
-                matched_idx.update(range(lo, hi))
-                hits.append((sent_idx, finder.__name__, hit))
+    if not hits:
+        return SplitResult(
+            matched="",
+            notmatched=" ".join(sentences).strip(),
+            sentences=list(sentences),
+            mask=[False] * len(sentences),
+            matched_ix=[],
+            hits=[],
+        )
 
-    mask = [i in matched_idx for i in range(len(sentences))]
-    matched_ix = sorted(matched_idx)
+    keep = _window_mask((h[0] for h in hits), len(sentences), window_back, window_fwd)
+    mask = keep.tolist()
+    matched_ix = np.flatnonzero(keep).tolist()
     matched_sents = [sentences[i] for i in matched_ix]
-    notmatched_sents = [s for i, s in enumerate(sentences) if i not in matched_idx]
+    notmatched_sents = [s for s, k in zip(sentences, mask) if not k]
 
     return SplitResult(
         matched=" ".join(matched_sents).strip(),
         notmatched=" ".join(notmatched_sents).strip(),
-        sentences=sentences,
+        sentences=list(sentences),
         mask=mask,
         matched_ix=matched_ix,
-        hits=hits,
+        hits=list(hits),
     )
@@ -19,7 +19,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(spans))) if a < e <= b)
+    w_e = next(i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b)
     return w_s, w_e
 
 SECONDARY_RE = re.compile(r"\b(?:secondary|exploratory|post[- ]hoc|subgroup|additional)\b", re.I)
@@ -27,7 +27,8 @@ ANALYSIS_VERB_RE = re.compile(r"\b(?:analys(?:ed|is)|model(?:ed|ling)?|evaluat(?
 STAT_TEST_RE = re.compile(r"\b(?:cox|kaplan[- ]meier|log[- ]rank|mixed[- ]effects?|gee|logistic\s+regression|linear\s+regression|poisson|negative\s+binomial|anova|t[- ]test|chi[- ]square|fisher|wilcoxon|mann[- ]whitney)\b", re.I)
 HEAD_SEC_RE = re.compile(r"(?i)(statistical\s+analysis|secondary\s+analysis|subgroup\s+analysis|exploratory\s+analysis)\s*[:\-]?", re.M)
 TRAP_RE = re.compile(r"\bp\s*<\s*0\.\d+|significant|confidence\s+interval\b", re.I)
-TIGHT_TEMPLATE_RE = re.compile(r"secondary\s+outcomes?\s+analys(?:ed|is)\s+with\s+logistic\s+regression[.;]\s+[^.\n]{0,60}?subgroups?\s+examined", re.I)
+SECONDARY_CLAUSE_RE = re.compile(r"\b(?:secondary|subgroup|exploratory|post[- ]hoc|additional)\b.*?\b(?:analys(?:ed|is)|model(?:ed|ling)?|evaluat(?:ed|ion)|performed|examined|tested)\b", re.I)
+TIGHT_TEMPLATE_RE = re.compile(r"(?:secondary\s+outcomes?\s+analys(?:ed|is)|subgroup\s+analyses?\s+performed).*?logistic\s+regression.*?(?:subgroups?\s+examined|baseline\s+characteristics?)?", re.I | re.DOTALL)
 SUBGROUP_TERM_RE = re.compile(r"\b(?:subgroup|age\s+group|sex|gender|baseline\s+characteristic|interaction)\b", re.I)
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str):
@@ -42,8 +43,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_statistical_analysis_additional_method_v1(text: str):
-    pattern = re.compile(r"\b(?:secondary|subgroup|exploratory|post[- ]hoc|additional)\b.*?\b(?:analys(?:ed|is)|model(?:ed|ling)?|evaluat(?:ed|ion)|performed|examined|tested)\b",re.I )
-    return _collect([pattern], text)
+    return _collect([SECONDARY_CLAUSE_RE], text)
 
 def find_statistical_analysis_additional_method_v2(text: str, window: int = 4):
     spans = _token_spans(text)
@@ -54,7 +54,7 @@ def find_statistical_analysis_additional_method_v2(text: str, window: int = 4):
     for match in STAT_TEST_RE.finditer(text):
         start, end = match.start(), match.end()
         w_s = next(i for i, (s, e) in enumerate(spans) if s <= start < e)
-        w_e = next(i for i, (s, e) in reversed(list(enumerate(spans))) if s < end <= e)
+        w_e = next(i for i, (s, e) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if s < end <= e)
         test_idx.update(range(w_s, w_e+1))
     out = []
     for s_i in sec_idx:
@@ -92,8 +92,7 @@ def find_statistical_analysis_additional_method_v4(text: str, window: int = 6):
     return out
 
 def find_statistical_analysis_additional_method_v5(text: str):
-    pattern = re.compile(r"(?:secondary\s+outcomes?\s+analys(?:ed|is)|subgroup\s+analyses?\s+performed).*?logistic\s+regression.*?(?:subgroups?\s+examined|baseline\s+characteristics?)?", re.I | re.DOTALL)
-    return _collect([pattern], text)
+    return _collect([TIGHT_TEMPLATE_RE], text)
 
 STATISTICAL_ANALYSIS_ADDITIONAL_METHOD_FINDERS: Dict[str, Callable[[str], List[Tuple[int,int,str]]]] = {
     "v1": find_statistical_analysis_additional_method_v1,
@@ -22,7 +22,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -48,6 +48,10 @@ TIGHT_TEMPLATE_RE = re.compile(
     re.I,
 )
 
+# One of these literals is required by each template branch; without them the
+# [A-Za-z0-9,\s]+ run would only backtrack to fail.
+TIGHT_ANCHOR_RE = re.compile(r"age|sex|bmi|smok|multivaria", re.I)
+
 # ─────────────────────────────
 # 2.  Helper
 # ─────────────────────────────
@@ -73,7 +77,9 @@ def find_covariate_adjustment_v1(text: str) -> List[Tuple[int, int, str]]:
 
 def find_covariate_adjustment_v2(text: str, window: int = 4) -> List[Tuple[int, int, str]]:
     """Tier 2 – adjustment cue + link token within ±window tokens."""
-    token_spans = _token_spans(text)
+    return _v2_matches(text, _token_spans(text), window)
+
+def _v2_matches(text: str, token_spans: Sequence[Tuple[int, int]], window: int) -> List[Tuple[int, int, str]]:
     tokens = [text[s:e] for s, e in token_spans]
     link_idx = {i for i, t in enumerate(tokens) if LINK_TOKEN_RE.fullmatch(t)}
     out: List[Tuple[int, int, str]] = []
@@ -103,7 +109,7 @@ def find_covariate_adjustment_v4(text: str, window: int = 6) -> List[Tuple[int,
     token_spans = _token_spans(text)
     tokens = [text[s:e] for s, e in token_spans]
     cov_idx = {i for i, t in enumerate(tokens) if COVARIATE_KEY_RE.fullmatch(t)}
-    matches = find_covariate_adjustment_v2(text, window=window)
+    matches = _v2_matches(text, token_spans, window)
     out: List[Tuple[int, int, str]] = []
     for w_s, w_e, snip in matches:
         if any(c for c in cov_idx if w_s - window <= c <= w_e + window):
@@ -112,6 +118,8 @@ def find_covariate_adjustment_v4(text: str, window: int = 6) -> List[Tuple[int,
 
 def find_covariate_adjustment_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5 – tight template."""
+    if not TIGHT_ANCHOR_RE.search(text):
+        return []
     return _collect([TIGHT_TEMPLATE_RE], text)
 
 # ─────────────────────────────
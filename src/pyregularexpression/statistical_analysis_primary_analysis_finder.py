@@ -19,11 +19,12 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(spans))) if a < e <= b)
+    w_e = next(i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b)
     return w_s, w_e
 
 PRIMARY_KEY_RE = re.compile(r"\bprimary\s+(?:endpoint|outcome)\b", re.I)
 ANALYSIS_VERB_RE = re.compile(r"\b(?:analys(?:ed|is)|model(?:ed|ling)?|assess(?:ed|ment)?|evaluat(?:ed|ion)|tested)\b", re.I)
+PRIMARY_ANALYSIS_RE = re.compile(rf"{PRIMARY_KEY_RE.pattern}[^\.\n]{{0,10}}{ANALYSIS_VERB_RE.pattern}", re.I)
 ITT_RE = re.compile(r"\b(?:intention[- ]to[- ]treat|per[- ]protocol|modified\s+itt|mITT)\b", re.I)
 STAT_TEST_RE = re.compile(r"\b(?:cox(?:\s+proportional\s+hazards)?|kaplan[- ]meier|log[- ]rank|mixed[- ]effects?|generalised\s+estimating\s+equations|gee|linear\s+mixed|logistic\s+regression|poisson\s+regression|negative\s+binomial|anova|t[- ]test|chi[- ]square|fisher'?s\s+exact|wilcoxon|mann[- ]whitney|hazard\s+ratio|rate\s+ratio)\b", re.I)
 ADJUST_RE = re.compile(r"\b(?:adjust(?:ed|ing)?\s+for|covariate|baseline|stratified\s+by|random\s+effects|fixed\s+effects|repeated\s+measures)\b", re.I)
@@ -43,8 +44,7 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str):
     return out
 
 def find_statistical_analysis_primary_analysis_v1(text: str):
-    patterns = [re.compile(rf"{PRIMARY_KEY_RE.pattern}[^\.\n]{{0,10}}{ANALYSIS_VERB_RE.pattern}", re.I), ITT_RE]
-    return _collect(patterns, text)
+    return _collect([PRIMARY_ANALYSIS_RE, ITT_RE], text)
 
 def find_statistical_analysis_primary_analysis_v2(text: str, window: int = 4):
     spans = _token_spans(text)
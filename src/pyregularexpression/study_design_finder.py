@@ -13,6 +13,7 @@ Each function returns a list of tuples: (start_token_idx, end_token_idx, matched
 from __future__ import annotations
 import re
 from typing import List, Tuple, Sequence, Dict, Callable
+from pyregularexpression._finder_core import char_to_word as _char_span_to_word_span
 
 # ─────────────────────────────
 # 0.  Utilities
@@ -22,11 +23,8 @@ TOKEN_RE = re.compile(r"\S+")
 def _token_spans(text: str) -> List[Tuple[int, int]]:
     return [(m.start(), m.end()) for m in TOKEN_RE.finditer(text)]
 
-def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
-    s_char, e_char = span
-    w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
-    return w_start, w_end
+def _token_starts(token_spans: Sequence[Tuple[int, int]]) -> List[int]:
+    return [s for s, _ in token_spans]
 
 # ─────────────────────────────
 # 1.  Regex assets
@@ -56,13 +54,13 @@ TIGHT_TEMPLATE_RE = re.compile(
 # 2.  Helper
 # ─────────────────────────────
 def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int, int, str]]:
-    token_spans = _token_spans(text)
+    token_starts = _token_starts(_token_spans(text))
     out: List[Tuple[int, int, str]] = []
     for patt in patterns:
         for m in patt.finditer(text):
             if TRAP_RE.search(text[max(0, m.start()-20):m.end()+20]):
                 continue
-            w_s, w_e = _char_span_to_word_span((m.start(), m.end()), token_spans)
+            w_s, w_e = _char_span_to_word_span((m.start(), m.end()), token_starts)
             out.append((w_s, w_e, m.group(0)))
     return out
 
@@ -75,10 +73,11 @@ def find_study_design_v1(text: str) -> List[Tuple[int, int, str]]:
 def find_study_design_v2(text: str, window: int = 4) -> List[Tuple[int, int, str]]:
     token_spans = _token_spans(text)
     tokens = [text[s:e] for s, e in token_spans]
+    token_starts = _token_starts(token_spans)
     link_idx = {i for i, t in enumerate(tokens) if LINK_PHRASE_RE.fullmatch(t)}
     out = []
     for m in DESIGN_KEYWORD_RE.finditer(text):
-        w_s, w_e = _char_span_to_word_span((m.start(), m.end()), token_spans)
+        w_s, w_e = _char_span_to_word_span((m.start(), m.end()), token_starts)
         if any(l for l in link_idx if w_s - window <= l <= w_e + window):
             out.append((w_s, w_e, m.group(0)))
     return out
@@ -92,10 +91,11 @@ def find_study_design_v3(text: str, block_chars: int = 300) -> List[Tuple[int, i
         e = nxt if 0 <= nxt - s <= block_chars else s + block_chars
         blocks.append((s, e))
     inside = lambda p: any(s <= p < e for s, e in blocks)
+    token_starts = _token_starts(token_spans)
     out = []
     for m in DESIGN_KEYWORD_RE.finditer(text):
         if inside(m.start()):
-            w_s, w_e = _char_span_to_word_span((m.start(), m.end()), token_spans)
+            w_s, w_e = _char_span_to_word_span((m.start(), m.end()), token_starts)
             out.append((w_s, w_e, m.group(0)))
     return out
 
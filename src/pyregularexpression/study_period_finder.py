@@ -26,7 +26,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
     s_char, e_char = span
     w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
+    w_end = next(i for i, (s, e) in zip(range(len(token_spans) - 1, -1, -1), reversed(token_spans)) if s < e_char <= e)
     return w_start, w_end
 
 # ─────────────────────────────
@@ -47,6 +47,15 @@ TRAP_RE = re.compile(r"\bfollow[- ]?up\b", re.I)
 
 TIGHT_TEMPLATE_RE = re.compile(r"(?:study\s+period|data\s+collection)\s*[:\-]?\s+[^\.\n]{0,60}(?:\d{4}|Jan)\b[^\.\n]{0,60}", re.I)
 
+# every DATE_RANGE_RE match contains a YEAR, and every TIGHT_TEMPLATE_RE match
+# one of its lead words (casefold() mirrors re.I); a substring test rejects
+# most texts before the regex scan
+YEAR_LITERALS = ("19", "20")
+TIGHT_TEMPLATE_LITERALS = ("study", "data")
+
+def _has_year(text: str) -> bool:
+    return any(lit in text for lit in YEAR_LITERALS)
+
 # ─────────────────────────────
 # 2. Helper
 # ─────────────────────────────
@@ -66,10 +75,14 @@ def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int,
 # ─────────────────────────────
 def find_study_period_v1(text: str) -> List[Tuple[int, int, str]]:
     """Tier 1 – any date/year range."""    
+    if not _has_year(text):
+        return []
     return _collect([DATE_RANGE_RE], text)
 
 def find_study_period_v2(text: str, window: int = 5) -> List[Tuple[int, int, str]]:
     """Tier 2 – date range + study-term cue within ±window tokens."""    
+    if not _has_year(text):
+        return []
     token_spans = _token_spans(text)
     tokens = [text[s:e] for s, e in token_spans]
     term_idx = {i for i, t in enumerate(tokens) if STUDY_TERM_RE.search(t)}
@@ -82,6 +95,8 @@ def find_study_period_v2(text: str, window: int = 5) -> List[Tuple[int, int, str
 
 def find_study_period_v3(text: str, block_chars: int = 300) -> List[Tuple[int, int, str]]:
     """Tier 3 – inside Study period heading blocks."""    
+    if not _has_year(text):
+        return []
     token_spans = _token_spans(text)
     blocks: List[Tuple[int, int]] = []
     for h in HEADING_STUDY_RE.finditer(text):
@@ -99,6 +114,8 @@ def find_study_period_v3(text: str, block_chars: int = 300) -> List[Tuple[int, i
 
 def find_study_period_v4(text: str, window: int = 6) -> List[Tuple[int, int, str]]:
     """Tier 4 – v2 + explicit from/to keywords."""    
+    if not _has_year(text):
+        return []
     token_spans = _token_spans(text)
     tokens = [text[s:e] for s, e in token_spans]
     from_idx = {i for i, t in enumerate(tokens) if FROM_TO_RE.fullmatch(t)}
@@ -111,6 +128,9 @@ def find_study_period_v4(text: str, window: int = 6) -> List[Tuple[int, int, str
 
 def find_study_period_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5 – tight template form."""    
+    folded = text.casefold()
+    if not any(lit in folded for lit in TIGHT_TEMPLATE_LITERALS):
+        return []
     return _collect([TIGHT_TEMPLATE_RE], text)
 
 # ─────────────────────────────
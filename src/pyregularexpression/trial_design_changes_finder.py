@@ -20,7 +20,7 @@ def _token_spans(text: str) -> List[Tuple[int, int]]:
 def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
     s, e = span
     w_s = next(i for i, (a, b) in enumerate(spans) if a <= s < b)
-    w_e = next(i for i, (a, b) in reversed(list(enumerate(spans))) if a < e <= b)
+    w_e = next(i for i, (a, b) in zip(range(len(spans) - 1, -1, -1), reversed(spans)) if a < e <= b)
     return w_s, w_e
 
 CHANGE_CUE_RE = re.compile(r"\b(?:protocol\s+was\s+amended|protocol\s+amendment|amended\s+the\s+protocol|the\s+amended\s+protocol|amended\s+protocol|changes?\s+to\s+(?:the\s+)?(?:study|trial)\s+(?:design|protocol)|modified\s+(?:the\s+)?(?:trial|study)\s+protocol|unplanned\s+adjustments?|revised\s+inclusion\s+criteria|updated\s+study\s+design)\b", re.I)
@@ -8,21 +8,32 @@ Five variants (v1–v5):
 Each finder returns tuples: (start_word_idx, end_word_idx, snippet).
 """
 from __future__ import annotations
+import functools
 import re
+from bisect import bisect_left, bisect_right
 from typing import List, Tuple, Sequence, Dict, Callable
 
+from pyregularexpression._finder_core import char_to_word as _char_to_word
+from pyregularexpression._finder_core import cached_finder as _cached_finder
+from pyregularexpression._finder_core import for_text as _for_text
+from pyregularexpression._finder_core import token_spans as _core_token_spans
+
 TOKEN_RE = re.compile(r"\S+")
 
-def _token_spans(text: str) -> List[Tuple[int, int]]:
-    return [(m.start(), m.end()) for m in TOKEN_RE.finditer(text)]
+# Memoised: v1–v5 (and v4's inner v2 pass) are routinely run over the same
+# document, so each text is tokenised once.  Tuples keep the cache immutable.
+@functools.lru_cache(maxsize=128)
+def _token_spans(text: str) -> Tuple[Tuple[int, int], ...]:
+    starts, ends = _core_token_spans(text)
+    return tuple(zip(starts.tolist(), ends.tolist()))
 
-def _char_to_word(span: Tuple[int, int], spans: Sequence[Tuple[int, int]]):
-    s, e = span
-    w_s = next(i for i,(a,b) in enumerate(spans) if a<=s<b)
-    w_e = next(i for i,(a,b) in reversed(list(enumerate(spans))) if a<e<=b)
-    return w_s, w_e
+@functools.lru_cache(maxsize=128)
+def _token_starts(text: str) -> Tuple[int, ...]:
+    return tuple(s for s, _ in _token_spans(text))
 
-REGISTRY_ID_RE = re.compile(r"\b(?:NCT\d{8}|ISRCTN\d{6,8}|EudraCT\s*\d{4}-\d{6}-\d{2}|ChiCTR(?:-[\w\d]+)?|ACTRN\d{14}|JPRN-UMIN\d{9}|ClinicalTrials\.gov|ISRCTN|EudraCT|ChiCTR|ANZCTR|JPRN)\b", re.I)
+# Bare registry names share a branch with their numbered form (ISRCTN(?:\d+)?
+# rather than ISRCTN\d+|…|ISRCTN) so the engine tries each prefix once.
+REGISTRY_ID_RE = re.compile(r"\b(?:NCT\d{8}|ISRCTN(?:\d{6,8})?|EudraCT(?:\s*\d{4}-\d{6}-\d{2})?|ChiCTR(?:-[\w\d]+)?|ACTRN\d{14}|JPRN(?:-UMIN\d{9})?|ClinicalTrials\.gov|ANZCTR)\b", re.I)
 REG_CUE_PATTERNS = [
     re.compile(r"\b(?:trial\s+registration|registration\s+was\s+recorded)\b", re.I),
     re.compile(r"\bstudy(?:\s+\w+){0,2}?\s+registered\b", re.I),
@@ -34,95 +45,148 @@ REG_CUE_PATTERNS = [
 VERB_RE = re.compile(r"\b(?:registered|recorded|submitted|prospectively\s+registered)\b", re.I)
 HEAD_REG_RE = re.compile(r"(?m)^(?:trial\s+registration|registration)\s*[:\-]?\s*$", re.I)
 TIGHT_TEMPLATE_RE = re.compile(r"((?:this\s+)?trial\s+was\s+prospectively\s+registered(?:\s+at\s+[\w\.]+)?\s*\(?(?:NCT\d{8}|ISRCTN\d{6,8}|EudraCT\s*\d{4}-\d{6}-\d{2}|ChiCTR(?:-[\w\d]+)?)\)?)", re.I)
+# every TIGHT_TEMPLATE_RE match contains this; casefold() mirrors re.I, so a
+# substring test rejects most texts before the regex scan ("prospect" rather
+# than "prospectively": re.I also lets "i" match a dotless "ı")
+TIGHT_TEMPLATE_LITERAL = "prospect"
 TRAP_RE = re.compile(r"\bIRB\s+|ethical\s+approval|registry\s+of\s+deeds\b", re.I)
+# every cue pattern plus the registry ID pattern, in reporting order
+CUE_AND_ID_PATTERNS = (*REG_CUE_PATTERNS, REGISTRY_ID_RE)
+
+# existence gate: search() stops at the first hit, so texts without any cue
+# are rejected before they are tokenised.  Compiled on first use – the union
+# is the costliest pattern in the module and only v2 needs it.
+@functools.lru_cache(maxsize=None)
+def _any_cue_re() -> re.Pattern[str]:
+    return re.compile("|".join(f"(?:{p.pattern})" for p in CUE_AND_ID_PATTERNS), re.I)
+
+# One TRAP_RE pass per text, shared by v1 and v5 through the cache.
+@functools.lru_cache(maxsize=128)
+def _trap_spans(text: str) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    traps = [(t.start(), t.end()) for t in _for_text(TRAP_RE, text).finditer(text)]
+    return tuple(s for s, _ in traps), tuple(e for _, e in traps)
 
 def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int, int, str]]:
-    spans = _token_spans(text)
+    starts = None  # tokenise lazily – most texts never produce a hit
+    # a hit only needs its ±40-char context re-checked when a trap actually
+    # overlaps that window
+    trap_starts, trap_ends = _trap_spans(text)
+    trap_re = _for_text(TRAP_RE, text)
     out: List[Tuple[int, int, str]] = []
     for patt in patterns:
-        for m in patt.finditer(text):
-            context = text[max(0, m.start() - 40): m.end() + 40]
-            if TRAP_RE.search(context):
+        for m in _for_text(patt, text).finditer(text):
+            lo, hi = max(0, m.start() - 40), m.end() + 40
+            i = bisect_right(trap_ends, lo)
+            if i < len(trap_ends) and trap_starts[i] < hi and trap_re.search(text[lo:hi]):
                 continue
-            w_s, w_e = _char_to_word((m.start(), m.end()), spans)
+            if starts is None:
+                starts = _token_starts(text)
+            w_s, w_e = _char_to_word((m.start(), m.end()), starts)
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_trial_registration_v1(text: str) -> List[Tuple[int, int, str]]:
     """Tier 1 – high recall: any registration cue or registry ID with trap filtering."""
-    spans = _token_spans(text)
-    out: List[Tuple[int, int, str]] = []
-
-    for patt in [*REG_CUE_PATTERNS, REGISTRY_ID_RE]:
-        for m in patt.finditer(text):
-            context = text[max(0, m.start() - 40): m.end() + 40]
-            if TRAP_RE.search(context):
-                continue
-            w_s, w_e = _char_to_word((m.start(), m.end()), spans)
-            out.append((w_s, w_e, m.group(0)))
-    
-    return out
+    return _collect(CUE_AND_ID_PATTERNS, text)
 
+@_cached_finder
 def find_trial_registration_v2(text: str, window: int = 6):
-    spans = _token_spans(text)
-    
+    if not _for_text(_any_cue_re(), text).search(text):
+        return []
+    return _v2_matches(text, _token_starts(text), window)
+
+def _v2_matches(text: str, starts: Sequence[int], window: int):
     cues = {} # Using dict to store cue info, with start word as key
-    for patt in [*REG_CUE_PATTERNS, REGISTRY_ID_RE]:
-        for m in patt.finditer(text):
-            w_s, w_e = _char_to_word((m.start(), m.end()), spans)
+    for patt in CUE_AND_ID_PATTERNS:
+        for m in _for_text(patt, text).finditer(text):
+            w_s, w_e = _char_to_word((m.start(), m.end()), starts)
             # If multiple cues start at the same word, the longest is kept
             if w_s not in cues or len(m.group(0)) > len(cues[w_s][2]):
                 cues[w_s] = (w_s, w_e, m.group(0))
             
-    verb_idx = set()
-    for m in VERB_RE.finditer(text):
-        w_s, w_e = _char_to_word((m.start(), m.end()), spans)
-        for i in range(w_s, w_e + 1):
-            verb_idx.add(i)
+    # finditer runs left to right, so token ranges arrive in order and can
+    # only share their boundary token: appending the unseen tail keeps the
+    # list sorted and duplicate-free without a set
+    verbs: List[int] = []
+    for m in _for_text(VERB_RE, text).finditer(text):
+        w_s, w_e = _char_to_word((m.start(), m.end()), starts)
+        verbs.extend(range(max(w_s, verbs[-1] + 1) if verbs else w_s, w_e + 1))
 
     out: List[Tuple[int, int, str]] = []
     for c_start, cue_data in cues.items():
         c_end = cue_data[1]
-
-        verb_is_near = False
-        for i in range(c_start, c_end + 1):
-            for v_idx in verb_idx:
-                if abs(i - v_idx) <= window:
-                    verb_is_near = True
-                    break
-            if verb_is_near:
-                break
-
-        if verb_is_near:
+        # nearest verb at or after c_start - window must not pass c_end + window
+        i = bisect_left(verbs, c_start - window)
+        if i < len(verbs) and verbs[i] <= c_end + window:
             out.append(cue_data)
 
     return out
 
+@functools.lru_cache(maxsize=128)
+def _heading_blocks(text: str, block_chars: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Registration-heading blocks merged into disjoint, sorted (starts, ends)."""
+    starts: List[int] = []
+    ends: List[int] = []
+    for h in _for_text(HEAD_REG_RE, text).finditer(text):
+        s, e = h.end(), min(len(text), h.end() + block_chars)
+        if ends and s <= ends[-1]:
+            ends[-1] = max(ends[-1], e)
+        else:
+            starts.append(s)
+            ends.append(e)
+    return tuple(starts), tuple(ends)
+
+@_cached_finder
 def find_trial_registration_v3(text: str, block_chars: int = 400):
-    spans = _token_spans(text)
-    blocks = [(h.end(), min(len(text), h.end() + block_chars)) for h in HEAD_REG_RE.finditer(text)]
-    inside = lambda p: any(s <= p < e for s, e in blocks)
+    if not _for_text(HEAD_REG_RE, text).search(text):
+        return []
+    starts = _token_starts(text)
+    block_starts, block_ends = _heading_blocks(text, block_chars)
+
+    def inside(p: int) -> bool:
+        i = bisect_right(block_starts, p) - 1
+        return i >= 0 and p < block_ends[i]
+
     out = []
-    for patt in [*REG_CUE_PATTERNS, REGISTRY_ID_RE]:
-        for m in patt.finditer(text):
+    for patt in CUE_AND_ID_PATTERNS:
+        for m in _for_text(patt, text).finditer(text):
             if inside(m.start()):
-                w_s, w_e = _char_to_word((m.start(), m.end()), spans)
+                w_s, w_e = _char_to_word((m.start(), m.end()), starts)
                 out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_trial_registration_v4(text: str, window: int = 6):
+    id_re = _for_text(REGISTRY_ID_RE, text)
+    if not id_re.search(text):
+        return []
     spans = _token_spans(text)
-    tokens = [text[s:e] for s, e in spans]
-    id_idx = {i for i, t in enumerate(tokens) if REGISTRY_ID_RE.fullmatch(t.strip('.,'))}
-    matches = find_trial_registration_v2(text, window=window)
+    starts = _token_starts(text)
+    # Only tokens holding an ID hit can be a whole-token ID: let finditer pick
+    # the candidates instead of running fullmatch over every token.
+    # hits arrive in text order, so ids stays sorted; skip repeats of the
+    # token just added
+    ids: List[int] = []
+    for m in id_re.finditer(text):
+        i = bisect_right(starts, m.start()) - 1
+        if ids and ids[-1] == i:
+            continue
+        if id_re.fullmatch(text[spans[i][0]:spans[i][1]].strip('.,')):
+            ids.append(i)
+    matches = _v2_matches(text, starts, window)
     out: List[Tuple[int, int, str]] = []
     for w_s, w_e, snip in matches:
-        if any(w_s - window <= k <= w_e + window for k in id_idx):
+        i = bisect_left(ids, w_s - window)
+        if i < len(ids) and ids[i] <= w_e + window:
             out.append((w_s, w_e, snip))
     return out
 
+@_cached_finder
 def find_trial_registration_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5 – tight template: prospectively registered trial with registry ID."""
+    if TIGHT_TEMPLATE_LITERAL not in text.casefold():
+        return []
     return _collect([TIGHT_TEMPLATE_RE], text)
 
 TRIAL_REGISTRATION_FINDERS: Dict[str, Callable[[str], List[Tuple[int, int, str]]]] = {
@@ -9,9 +9,16 @@ Five variants (v1‑v5):
 Each function returns a list of tuples: (start_token_idx, end_token_idx, matched_snippet)
 """
 from __future__ import annotations
+import functools
 import re
+from bisect import bisect_left, bisect_right
 from typing import List, Tuple, Sequence, Dict, Callable
 
+from pyregularexpression._finder_core import char_to_word as _char_span_to_word_span
+from pyregularexpression._finder_core import cached_finder as _cached_finder
+from pyregularexpression._finder_core import for_text as _for_text
+from pyregularexpression._finder_core import token_spans as _core_token_spans
+
 # ─────────────────────────────
 # 0.  Shared utilities
 # ─────────────────────────────
@@ -24,14 +31,16 @@ NUMBER_WORD = r"(?:one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelv
 
 TOKEN_RE = re.compile(r"\S+")
 
-def _token_spans(text: str) -> List[Tuple[int, int]]:
-    return [(m.start(), m.end()) for m in TOKEN_RE.finditer(text)]
+# Memoised (immutable tuples): callers typically run the whole v1–v5 ladder
+# over one document, and each variant needs the same token spans.
+@functools.lru_cache(maxsize=128)
+def _token_spans(text: str) -> Tuple[Tuple[int, int], ...]:
+    starts, ends = _core_token_spans(text)
+    return tuple(zip(starts.tolist(), ends.tolist()))
 
-def _char_span_to_word_span(span: Tuple[int, int], token_spans: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
-    s_char, e_char = span
-    w_start = next(i for i, (s, e) in enumerate(token_spans) if s <= s_char < e)
-    w_end = next(i for i, (s, e) in reversed(list(enumerate(token_spans))) if s < e_char <= e)
-    return w_start, w_end
+@functools.lru_cache(maxsize=128)
+def _token_starts(text: str) -> Tuple[int, ...]:
+    return tuple(s for s, _ in _token_spans(text))
 
 # ─────────────────────────────
 # 1.  Regex assets
@@ -66,123 +75,164 @@ HEADING_WASHOUT_RE = re.compile(
     r")\s*[:\-]"
 )
 
+# cue and duration vocabularies never overlap, so one alternation finds
+# exactly the union of both scans (dispatch on ``m.lastgroup``).  Compiled on
+# first use: only v2/v4 need it, and it is the module's costliest pattern.
+@functools.lru_cache(maxsize=None)
+def _cue_or_duration_re() -> re.Pattern[str]:
+    return re.compile(
+        rf"(?P<cue>{WASHOUT_CUE_RE.pattern})|(?P<dur>{DURATION_RE.pattern})",
+        re.IGNORECASE | re.VERBOSE,
+    )
+
 TRAP_RE = re.compile(r"\b(?:stopped|discontinued|due\s+to\s+side[- ]?effects|adverse\s+events?)\b", re.I)
 
 TIGHT_TEMPLATE_RE = re.compile(
     r"(?:\d+[- ]?(?:month|week|year)s?\s+washout(?:\s+period)?\s+with\s+no\s+[a-z\s]{1,40}(?:\s+was\s+required|\s+was\s+implemented|\s+completed)?|drug[- ]?free\s+for\s+\d+[- ]?(?:month|week|year)s?\s+before\s+index)",
     re.I,
 )
+# every TIGHT_TEMPLATE_RE match contains one of these; casefold() mirrors
+# re.I, so a substring test rejects most texts before the regex scan
+TIGHT_TEMPLATE_LITERALS = ("washout", "free")
 
 # ─────────────────────────────
 # 2.  Helper
 # ─────────────────────────────
 def _collect(patterns: Sequence[re.Pattern[str]], text: str) -> List[Tuple[int, int, str]]:
-    token_spans = _token_spans(text)
+    token_starts = None  # tokenise lazily – most texts never produce a hit
+    trap_re = _for_text(TRAP_RE, text)
     out: List[Tuple[int, int, str]] = []
     for patt in patterns:
-        for m in patt.finditer(text):
-            if TRAP_RE.search(m.group(0)):
+        for m in _for_text(patt, text).finditer(text):
+            if trap_re.search(m.group(0)):
                 continue
-            w_s, w_e = _char_span_to_word_span((m.start(), m.end()), token_spans)
+            if token_starts is None:
+                token_starts = _token_starts(text)
+            w_s, w_e = _char_span_to_word_span((m.start(), m.end()), token_starts)
             out.append((w_s, w_e, m.group(0)))
     return out
 
-def _char_to_token_index_map(text: str, token_spans: List[Tuple[int,int]]) -> Dict[int,int]:
-    """Map each character position to its token index."""
-    char2tok = {}
-    for tok_i, (s,e) in enumerate(token_spans):
-        for pos in range(s, e):
-            char2tok[pos] = tok_i
-    return char2tok
+def _token_at(pos: int, token_spans: Sequence[Tuple[int, int]], token_starts: Sequence[int]) -> int | None:
+    """Index of the token containing char *pos*, or None if *pos* is whitespace."""
+    i = bisect_right(token_starts, pos) - 1
+    return i if i >= 0 and pos < token_spans[i][1] else None
+
+def _cue_and_duration_hits(text: str, token_spans: Sequence[Tuple[int, int]], token_starts: Sequence[int]):
+    """Single scan → (cue hits, duration hits), each a list of (match, token_idx)."""
+    hits: Dict[str, List[Tuple[re.Match[str], int]]] = {"cue": [], "dur": []}
+    for m in _for_text(_cue_or_duration_re(), text).finditer(text):
+        tok = _token_at(m.start(), token_spans, token_starts)
+        if tok is not None:
+            hits[m.lastgroup].append((m, tok))
+    return hits["cue"], hits["dur"]
 
 # ─────────────────────────────
 # 3.  Finder variants
 # ─────────────────────────────
+@_cached_finder
 def find_washout_period_v1(text: str) -> List[Tuple[int, int, str]]:
     """Tier 1 – any washout/run‑in cue."""    
     return _collect([WASHOUT_CUE_RE], text)
 
+@_cached_finder
 def find_washout_period_v2(text: str, window: int = 8) -> List[Tuple[int, int, str]]:
     """Tier 2 – cue + duration within ±window characters."""
+    if not _for_text(WASHOUT_CUE_RE, text).search(text):
+        return []
     out = []
     token_spans = _token_spans(text)
-    char2tok = _char_to_token_index_map(text, token_spans)
-
-    for cue_match in WASHOUT_CUE_RE.finditer(text):
-        cue_tok = char2tok.get(cue_match.start())
-        if cue_tok is None:
-            continue
-        for dur_match in DURATION_RE.finditer(text):
-            dur_tok = char2tok.get(dur_match.start())
-            if dur_tok is None or abs(cue_tok - dur_tok) > window:
-                continue
+    token_starts = _token_starts(text)
+
+    cue_hits, dur_hits = _cue_and_duration_hits(text, token_spans, token_starts)
+    dur_toks = [tok for _, tok in dur_hits]  # text order ⇒ sorted
+    trap_re = _for_text(TRAP_RE, text)
+
+    for cue_match, cue_tok in cue_hits:
+        lo = bisect_left(dur_toks, cue_tok - window)
+        hi = bisect_right(dur_toks, cue_tok + window)
+        for dur_match, _ in dur_hits[lo:hi]:
             # now check trap
-            if TRAP_RE.search(text[cue_match.start(): dur_match.end()]):
+            if trap_re.search(text[cue_match.start(): dur_match.end()]):
                 continue
             # good: build span
             span = (
                 min(cue_match.start(), dur_match.start()),
                 max(cue_match.end(),   dur_match.end())
             )
-            w_s, w_e = _char_span_to_word_span(span, token_spans)
+            w_s, w_e = _char_span_to_word_span(span, token_starts)
             out.append((w_s, w_e, text[span[0]:span[1]]))
             break
     return out
 
+@_cached_finder
 def find_washout_period_v3(text: str, block_chars: int = 500) -> List[Tuple[int, int, str]]:
     """
     Tier 3 – match any duration or cue inside heading blocks (e.g., "Washout Period:", "Run-in:", etc.).
     """
-    token_spans = _token_spans(text)
+    heading_re = _for_text(HEADING_WASHOUT_RE, text)
+    if not heading_re.search(text):
+        return []
+    token_starts = _token_starts(text)
+    cue_re = _for_text(WASHOUT_CUE_RE, text)
+    dur_re = _for_text(DURATION_RE, text)
+    trap_re = _for_text(TRAP_RE, text)
     out: List[Tuple[int, int, str]] = []
 
     # Find all heading blocks like "Washout Period:", "Run-in:", etc.
-    for heading_match in HEADING_WASHOUT_RE.finditer(text):
+    for heading_match in heading_re.finditer(text):
         block_start = heading_match.end()
         block_end = block_start + block_chars
         block = text[block_start:block_end]
 
         # Look for both cue and duration matches inside this block
-        for m in list(WASHOUT_CUE_RE.finditer(block)) + list(DURATION_RE.finditer(block)):
-            if TRAP_RE.search(m.group(0)):
+        for m in list(cue_re.finditer(block)) + list(dur_re.finditer(block)):
+            if trap_re.search(m.group(0)):
                 continue
             abs_start = block_start + m.start()
             abs_end = block_start + m.end()
-            w_s, w_e = _char_span_to_word_span((abs_start, abs_end), token_spans)
+            w_s, w_e = _char_span_to_word_span((abs_start, abs_end), token_starts)
             out.append((w_s, w_e, m.group(0)))
     return out
 
+@_cached_finder
 def find_washout_period_v4(text: str, window: int = 8) -> List[Tuple[int, int, str]]:
     """Tier 4 – cue + duration + anchor (e.g., before/prior to)."""
+    if not _for_text(WASHOUT_CUE_RE, text).search(text):
+        return []
     token_spans = _token_spans(text)
+    token_starts = _token_starts(text)
     out = []
-    char2tok = _char_to_token_index_map(text, token_spans)
-
-    for cue_match in WASHOUT_CUE_RE.finditer(text):
-        cue_tok = char2tok.get(cue_match.start())
-        if cue_tok is None:
-            continue
-        for dur_match in DURATION_RE.finditer(text):
-            dur_tok = char2tok.get(dur_match.start())
-            if dur_tok is None or abs(cue_tok - dur_tok) > window:
-                continue
+
+    cue_hits, dur_hits = _cue_and_duration_hits(text, token_spans, token_starts)
+    dur_toks = [tok for _, tok in dur_hits]  # text order ⇒ sorted
+    anchor_re = _for_text(BEFORE_ANCHOR_RE, text)
+    trap_re = _for_text(TRAP_RE, text)
+
+    for cue_match, cue_tok in cue_hits:
+        lo = bisect_left(dur_toks, cue_tok - window)
+        hi = bisect_right(dur_toks, cue_tok + window)
+        for dur_match, _ in dur_hits[lo:hi]:
             # check anchor + trap in the 40‑char snippet
             snippet = text[
                 min(cue_match.start(), dur_match.start()):
                 max(cue_match.end(), dur_match.end()) + 40
             ]
-            if BEFORE_ANCHOR_RE.search(snippet) and not TRAP_RE.search(snippet):
+            if anchor_re.search(snippet) and not trap_re.search(snippet):
                 span = (
                     min(cue_match.start(), dur_match.start()),
                     max(cue_match.end(),   dur_match.end())
                 )
-                w_s, w_e = _char_span_to_word_span(span, token_spans)
+                w_s, w_e = _char_span_to_word_span(span, token_starts)
                 out.append((w_s, w_e, text[span[0]:span[1]]))
                 break
     return out
 
+@_cached_finder
 def find_washout_period_v5(text: str) -> List[Tuple[int, int, str]]:
     """Tier 5 – tight template with cue + duration + 'no drugs'."""
+    folded = text.casefold()
+    if not any(lit in folded for lit in TIGHT_TEMPLATE_LITERALS):
+        return []
     return _collect([TIGHT_TEMPLATE_RE], text)
 
 # ─────────────────────────────
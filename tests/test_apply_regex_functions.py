@@ -1,5 +1,9 @@
 import pytest
-from pyregularexpression.apply_regex_functions import apply_regex_funcs
+from pyregularexpression.apply_regex_functions import (
+    REGEX_FUNCS_PHENOTYPE_ALGORITHM_1,
+    apply_regex_funcs,
+    apply_regex_funcs_batch,
+)
 
 def find_a(text):
     return [(0, 1, 'a')] if 'a' in text else []
@@ -64,3 +68,18 @@ def test_apply_regex_funcs_type_error_handling():
     # the function or log an error. For now, we test the buggy behavior.
     with pytest.raises(TypeError):
         apply_regex_funcs(text, funcs)
+
+def test_apply_regex_funcs_batch_in_process():
+    texts = ["abc", "xyz", "b"]
+    results = apply_regex_funcs_batch(texts, [find_a, find_b], max_workers=1)
+    assert results == [apply_regex_funcs(t, [find_a, find_b]) for t in texts]
+
+def test_apply_regex_funcs_batch_process_pool_matches_sequential():
+    texts = [
+        "Patients with ICD-10 code I60 were included.",
+        "Nothing special here.",
+        "Lost to follow-up was recorded in 5% of cases.",
+    ]
+    funcs = REGEX_FUNCS_PHENOTYPE_ALGORITHM_1[:4]
+    pooled = apply_regex_funcs_batch(texts, funcs, max_workers=2, chunksize=1)
+    assert pooled == [apply_regex_funcs(t, funcs) for t in texts]
@@ -0,0 +1,65 @@
+# tests/test_finder_core.py
+"""
+Tests for the private helpers in _finder_core shared by the finder modules.
+"""
+
+import re
+
+import pytest
+from pyregularexpression._finder_core import for_text, token_spans
+
+TOKEN_RE = re.compile(r"\S+")
+WORD_RE = re.compile(r"\bwash\w*\s+period\b", re.I)
+
+# ─────────────────────────────
+# token_spans agrees with re.finditer(r"\S+")
+# ─────────────────────────────
+@pytest.mark.parametrize(
+    "text",
+    ["", "   ", "washout", " a\tb\nc ", "x\x1cy\x85z\xa0w v", "é K ſ"],
+)
+def test_token_spans_match_token_re(text):
+    starts, ends = token_spans(text)
+    expected = [(m.start(), m.end()) for m in TOKEN_RE.finditer(text)]
+    assert list(zip(starts.tolist(), ends.tolist())) == expected
+
+# ─────────────────────────────
+# for_text only swaps in the re.ASCII twin when matches cannot change
+# ─────────────────────────────
+@pytest.mark.parametrize(
+    "text, uses_ascii",
+    [
+        ("A two-week washout period was required.", True),
+        ("A two-week washout\x1cperiod was required.", False),
+        ("A two-week WAſHOUT period was required.", False),
+        ("A two-week washout period – was required.", False),
+    ],
+)
+def test_for_text_picks_ascii_twin_only_when_safe(text, uses_ascii):
+    patt = for_text(WORD_RE, text)
+    assert bool(patt.flags & re.ASCII) == uses_ascii
+    assert patt.pattern == WORD_RE.pattern
+    assert [m.span() for m in patt.finditer(text)] == [m.span() for m in WORD_RE.finditer(text)]
+
+# ─────────────────────────────
+# cached_finder memoises results but hands out fresh lists
+# ─────────────────────────────
+def test_cached_finder_returns_fresh_lists_and_clears():
+    from pyregularexpression._finder_core import cached_finder, clear_finder_cache
+
+    calls = []
+
+    @cached_finder
+    def find_words(text, window=1):
+        calls.append(text)
+        return [(m.start(), m.end(), m.group(0)) for m in TOKEN_RE.finditer(text)]
+
+    first = find_words("washout period")
+    first.append((9, 9, "mutated"))
+    assert find_words("washout period") == [(0, 7, "washout"), (8, 14, "period")]
+    assert calls == ["washout period"]
+    find_words("washout period", window=2)
+    assert len(calls) == 2
+    clear_finder_cache()
+    find_words("washout period")
+    assert len(calls) == 3
@@ -1,21 +1,3 @@
-'''
-"""Smoke tests for follow_up_period_finder variants."""
-from pyregularexpression.follow_up_period_finder import FOLLOW_UP_PERIOD_FINDERS
-
-examples = {
-    "hit_median": "Median follow-up was 5 years.",
-    "hit_followed_for": "Participants were followed for 24 months after index.",
-    "miss_visit": "All patients attended follow-up visits at 3 months.",
-    "miss_calendar": "The study observation period was from 2010 to 2020."
-}
-
-for label, txt in examples.items():
-    print(f"\n=== {label} ===\n{txt}")
-    for name, fn in FOLLOW_UP_PERIOD_FINDERS.items():
-        print(f" {name}: {fn(txt)}")
-'''
-
-
 # tests/test_follow_up_period_finder.py
 """
 Complete test suite for follow_up_period_finder.py.
@@ -32,6 +14,7 @@ from pyregularexpression.follow_up_period_finder import (
     find_follow_up_period_v3,
     find_follow_up_period_v4,
     find_follow_up_period_v5,
+    FOLLOW_UP_PERIOD_FINDERS,
 )
 
 # ────────────────────────────────────
@@ -130,3 +113,33 @@ def test_find_follow_up_period_v4(text, should_match, test_id):
 def test_find_follow_up_period_v5(text, should_match, test_id):
     matches = find_follow_up_period_v5(text)
     assert bool(matches) == should_match, f"v5 failed for ID: {test_id}"
+
+# ────────────────────────────────────
+# Smoke examples: high-recall v1 finds every hit
+# ────────────────────────────────────
+@pytest.mark.parametrize(
+    "text, should_match, test_id",
+    [
+        ("Median follow-up was 5 years.", True, "smoke_v1_hit_median"),
+        ("Participants were followed for 24 months after index.", True, "smoke_v1_hit_followed_for"),
+    ]
+)
+def test_follow_up_period_smoke_v1(text, should_match, test_id):
+    matches = FOLLOW_UP_PERIOD_FINDERS["v1"](text)
+    assert bool(matches) == should_match, f"v1 failed for ID: {test_id}"
+
+# ────────────────────────────────────
+# Smoke examples: high-precision v5 keeps the hits and rejects the misses
+# ────────────────────────────────────
+@pytest.mark.parametrize(
+    "text, should_match, test_id",
+    [
+        ("Median follow-up was 5 years.", True, "smoke_v5_hit_median"),
+        ("Participants were followed for 24 months after index.", True, "smoke_v5_hit_followed_for"),
+        ("All patients attended follow-up visits at 3 months.", False, "smoke_v5_miss_visit"),
+        ("The study observation period was from 2010 to 2020.", False, "smoke_v5_miss_calendar"),
+    ]
+)
+def test_follow_up_period_smoke_v5(text, should_match, test_id):
+    matches = FOLLOW_UP_PERIOD_FINDERS["v5"](text)
+    assert bool(matches) == should_match, f"v5 failed for ID: {test_id}"
@@ -52,6 +52,9 @@ def test_find_recruitment_timeline_v1(text, should_match, test_id):
         ("Subjects were enrolled in 2016.", False, "v2_neg_no_separator"),
         # Negative: date range but no recruitment cue
         ("The study spanned 2008–2010 with follow-up later.", False, "v2_neg_no_cue"),
+        # Negative: date ranges are case-sensitive (uppercase separator, lowercase month)
+        ("Patients were recruited 2015 TO 2018 at two sites.", False, "v2_neg_uppercase_separator"),
+        ("Patients were enrolled january 2015 - march 2018.", False, "v2_neg_lowercase_month"),
     ],
 )
 def test_find_recruitment_timeline_v2(text, should_match, test_id):
@@ -10,16 +10,13 @@ import importlib
 from typing import List
 
 import pytest
-from nltk.tokenize import sent_tokenize  # ensures sentence boundaries match helper
-
-import nltk
-nltk.download('punkt')
-nltk.download('punkt_tab') 
 
 # Runtime import because the library lives in the editable src tree during CI
 split_mod = importlib.import_module("pyregularexpression.split_text_filter")
 
 split_text_by_filter = split_mod.split_text_by_filter
+# the helper's own Punkt instance, so sentence boundaries match it
+sent_tokenize = split_mod._tokenizer().tokenize
 
 from pyregularexpression.medical_code_finder import find_medical_code_v1  # type: ignore
 from pyregularexpression.algorithm_validation_finder import find_algorithm_validation_v1  # type: ignore
@@ -57,6 +54,20 @@ def test_no_match_returns_all_unmatched():
     assert out.notmatched == "Nothing special here."
 
 
+def test_no_finders_returns_all_unmatched(sample_text):
+    out = split_text_by_filter(sample_text, [])
+    assert out.matched == "" and out.hits == [] and out.matched_ix == []
+    assert out.mask == [False] * len(out.sentences)
+    assert out.notmatched == " ".join(out.sentences)
+
+
+def test_out_of_range_spans_are_ignored(sample_text):
+    def bad_spans(text):
+        return [(-1, -1, "neg"), (10_000, 10_001, "past_end")]
+    out = split_text_by_filter(sample_text, [bad_spans])
+    assert out.hits == [] and out.matched == ""
+
+
 def test_basic_matches(sample_text):
     out = _run(sample_text)
     # Should retain keywords from each finder
@@ -118,3 +118,26 @@ def test_find_trial_registration_v5(text, expected_matches, test_id):
     assert sorted(matched_snippets) == sorted(expected_matches), f"v5 failed for ID: {test_id}"
 
 #
+
+# ─────────────────────────────
+# char → token mapping (bisect) matches a linear scan
+# ─────────────────────────────
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Trial registration: NCT04567890.",
+        "  The study  was\nregistered at ClinicalTrials.gov ",
+        "registered",
+    ]
+)
+def test_char_to_word_matches_linear_scan(text):
+    from pyregularexpression.trial_registration_finder import _char_to_word, _token_spans, _token_starts
+    spans = _token_spans(text)
+    starts = _token_starts(text)
+    for a, b in spans:
+        for s in range(a, b):
+            for e in range(s + 1, b + 1):
+                expected_s = next(i for i, (x, y) in enumerate(spans) if x <= s < y)
+                expected_e = next(i for i, (x, y) in enumerate(spans) if x < e <= y)
+                assert _char_to_word((s, e), starts) == (expected_s, expected_e)
+    assert _char_to_word((spans[0][0], spans[-1][1]), starts) == (0, len(spans) - 1)
@@ -103,3 +103,15 @@ def test_find_washout_period_v4(text, should_match, test_id):
 def test_find_washout_period_v5(text, should_match, test_id):
     matches = find_washout_period_v5(text)
     assert bool(matches) == should_match, f"v5 failed for ID: {test_id}"
+
+# ─────────────────────────────────────────────
+# char → token mapping (bisect) matches a linear scan
+# ─────────────────────────────────────────────
+def test_token_at_matches_linear_scan():
+    from pyregularexpression.washout_period_finder import _token_at, _token_spans, _token_starts
+    text = "  A 6-week  washout\nperiod. "
+    spans = _token_spans(text)
+    starts = _token_starts(text)
+    for pos in range(len(text)):
+        expected = next((i for i, (s, e) in enumerate(spans) if s <= pos < e), None)
+        assert _token_at(pos, spans, starts) == expected